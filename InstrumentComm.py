@@ -11,6 +11,38 @@ communication abilities to any individual instrument class.
 
 
 VERSION HISTORY
+[10-14-2026] tobytes()/tostring() are now plain type checks instead of singledispatch.
+             write() caches the encoded, terminated form of recently-sent string commands.
+             Added write_many() and batched_writes() to send command sequences in one backend write.
+             Added ask_async(), which runs transactions on a shared thread pool and returns Futures.
+             GPIB and VISA ask() read raw bytes instead of query_ascii_values(); added ask_binary().
+             openGPIBport() matches parsed addresses, so address 1 no longer matches 'GPIB0::12::INSTR'.
+             One shared ResourceManager per VISA backend, and briefly cached bus inventories.
+             VISA instruments now actually open through pyvisa-py outside Windows, as intended.
+             RS232.read() trims its terminator before decoding, and does so only once.
+             RS-232 ports are switched to low-latency mode on open where Linux allows it.
+             openRS232port() kwargs no longer permanently overwrite the stored RS232params.
+             The decoded line terminator is cached instead of re-decoded on every transaction.
+             Added ask_array() to read IEEE-488.2 binary blocks straight into NumPy arrays.
+             Known-address arguments are normalized by _as_list() rather than try/len()/except.
+             Exceptions look up their raise site with sys._getframe() instead of inspect.stack().
+             Diagnostic print()s now go through the module logger at DEBUG level.
+             tobytes()/tostring() trimmed to one isinstance() branch apiece.
+             Terminators are encoded directly in __init__() rather than through tobytes().
+             VISA hands termination to PyVISA's write_termination/read_termination.
+             Added ask_cached() and invalidate_ask_cache() for short-lived caching of idempotent queries.
+             USBTMC.ask() no longer re-wraps python-usbtmc's string response.
+             Per-interface exceptions now just set a label on Instrument_Labeled_Exception;
+             errorSite is now the real raising function rather than a subclass __init__().
+             PyVISA is imported on demand, when the first ResourceManager is needed.
+             RS485 caches libftdi's USB enumeration briefly, rescanning once if an open fails.
+             RS485.read() reads in bulk and frames responses itself, rather than via readline().
+             RS485.ask() no longer sleeps 10 ms per transaction unless pauseTime is set.
+             RS485.ask() raises inside batched_writes() rather than waiting out a timeout.
+             RS485 adapters are opened in binary mode, and each response is decoded just once.
+             RS485.read() calls libftdi's ftdi_read_data() directly, with a 1 ms adapter latency timer.
+             RS485 latency timer and USB chunk sizes are set at open, and configurable via kwargs.
+             RS485 runs its adapter I/O on a dedicated thread, so ask_async() hands back a Future at once.
 [12-23-2021] Improved kwargs handling/ignoring for RS-232 and CommBasics.
              Unicode formatting for tobytes()/tostring() is now settable at class instantiation.
              Upgraded error classes, because limiting a commit to a single acutally-needed issue is lame.
@@ -65,16 +97,68 @@ so calling scripts can then do
 --------------------------------------------------------------------
 """
 
-import pyvisa as visa
+import numpy as np
 import string
+import re
 import sys
 import time
-import inspect
-from functools import singledispatch # [https://docs.python.org/3/library/functools.html#functools.singledispatch]
+import logging
+import threading
+import queue
+import ctypes
+import weakref
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+
+
+logger = logging.getLogger(__name__) # Diagnostics go here instead of stdout; enable with logging.basicConfig(level=logging.DEBUG)
+GPIB_RESOURCE_REGEX = re.compile(r'GPIB\d*::(\d+)::') # Primary address in VISA resource strings such as 'GPIB0::12::INSTR'
+RESOURCE_LIST_TTL = 2 # [sec] how long a VISA bus inventory is trusted before rescanning
+STRUCT_FORMATS = {('f', 4): 'f', ('f', 8): 'd', ('i', 1): 'b', ('u', 1): 'B', ('i', 2): 'h', ('u', 2): 'H',
+                  ('i', 4): 'i', ('u', 4): 'I', ('i', 8): 'q', ('u', 8): 'Q'} # (NumPy dtype kind, itemsize): struct format character, for PyVISA's binary queries
+
+_resourcemanagers = {} # backend string: pyvisa.ResourceManager, one of each per process
+_resourcelists = {} # backend string: (time.monotonic() stamp, tuple of resource strings)
+
+
+def _as_list(x):
+    """
+    Normalizes a single address, a collection of addresses, or None into a fresh list.
+    """
+    if isinstance(x, (list, tuple, set)):
+        return list(x)
+    return [] if x is None else [x]
+
+
+def get_resourcemanager(backend=''):
+    """
+    Returns the process-wide PyVISA ResourceManager for the given backend ('' for the default,
+    '@py' for pyvisa-py, etc.), creating it on first use. Construction is slow--on Windows it
+    loads the VISA DLL--and PyVISA expects a single manager per process anyway.
+    """
+    if backend not in _resourcemanagers:
+        import pyvisa as visa # On demand, so RS-232/USBTMC-only users never pay for loading VISA [https://stackoverflow.com/q/13395116]
+        _resourcemanagers[backend] = visa.ResourceManager(backend) # For PyVISA 1.5+ [http://pyvisa.readthedocs.org/en/latest/migrating.html]
+    return _resourcemanagers[backend]
+
+
+def list_resources(backend=''):
+    """
+    Returns the resource manager's list_resources(), rescanning the bus only if the last
+    inventory is older than RESOURCE_LIST_TTL seconds.
+    """
+    stamp, resources = _resourcelists.get(backend, (None, ()))
+    if stamp is None or time.monotonic() - stamp > RESOURCE_LIST_TTL:
+        resources = get_resourcemanager(backend).list_resources()
+        _resourcelists[backend] = (time.monotonic(), resources)
+    return resources
 
 
 class CommBasics(object):
 
+    _askpool = None # ThreadPoolExecutor shared by every instrument's ask_async(), started on first use
+    _askpoollock = threading.Lock()
+
     def __init__(self, terminator='\r\n', readterminator='\r\n', byte_formatting='utf-8', **kwargs):
         """
         CommBasics bundles a few methods which should be shared by all derived classes.
@@ -87,31 +171,109 @@ class CommBasics(object):
         Beyond that, kwargs are accepted simply to allow inheriting classes to harmlessly pass
         unexplained keyword arguments intended for use downstream.
         """
-        # The hard way of getting singledispatchmethod [https://docs.python.org/3/library/functools.html#functools.singledispatchmethod]
         self.byte_formatting = byte_formatting
-        self.tobytes = singledispatch(self.tobytes)
-        self.tobytes.register(bytes, self._bytes_tobytes)
-        self.tobytes.register(bytearray, self._bytearray_tobytes)
-        self.tobytes.register(str, self._str_tobytes)
+        self._wbuf = None # List of queued commands while inside batched_writes()
+        self._asklock = threading.Lock() # Keeps this instrument's ask_async() transactions from interleaving
+        self._ask_cache = {} # command: (time.monotonic() expiry, response), for ask_cached()
+
+        # Terminators are always str or bytes literals, so encode them directly [https://stackoverflow.com/a/34870210]
+        self.lineterminator = terminator.encode(byte_formatting) if isinstance(terminator, str) else bytes(terminator)
+        self.readterminator = readterminator.encode(byte_formatting) if isinstance(readterminator, str) else bytes(readterminator)
+
+
+    @property
+    def lineterminator(self):
+        return self._lineterminator
+
+    @lineterminator.setter
+    def lineterminator(self, terminatorbytes):
+        """
+        Any change of terminator also updates its decoded string form and starts a fresh cache
+        of pre-terminated commands for write(). Accepts str as well, e.g. self.lineterminator = 'Dolores\r\n'.
+        """
+        if isinstance(terminatorbytes, str):
+            terminatorbytes = terminatorbytes.encode(self.byte_formatting)
+        self._lineterminator = bytes(terminatorbytes)
+        self._lineterm_str = terminatorbytes.decode(self.byte_formatting) # Decoded once here rather than on every read
+        self._wcache = {} # command: encoded and terminated bytes, for _encode_cmd()
+
+
+    def _encode_cmd(self, command):
+        """
+        Encodes a string command and appends the line terminator, remembering the result, since most
+        scripts send the same few dozen commands over and over. A plain dict, rather than an lru_cache
+        around a bound method, so the instance isn't left in a reference cycle with its own cache.
+        """
+        encoded = self._wcache.get(command)
+        if encoded is None:
+            if len(self._wcache) >= 256: # Scripts that build commands on the fly shouldn't grow it forever
+                self._wcache.clear()
+            encoded = self._wcache[command] = command.encode(self.byte_formatting) + self._lineterminator
+        return encoded
+
+
+    def _terminated(self, command):
+        """
+        Returns the command as bytes, with the instrument's preferred message termination characters appended.
+        """
+        return self._encode_cmd(command) if type(command) is str else self.tobytes(command) + self.lineterminator # Python3 strings default to Unicode, so need to be explicitly encoded
 
-        self.tostring = singledispatch(self.tostring)
-        self.tostring.register(bytes, self._bytes_tostring)
-        self.tostring.register(bytearray, self._bytearray_tostring)
-        self.tostring.register(str, self._str_tostring)
 
-        # Now we, and all inheriting classes, can convert things
-        self.lineterminator = self.tobytes(terminator) # Seems the safest and easiest of [https://stackoverflow.com/a/34870210]
-        self.readterminator = self.tobytes(readterminator)
+    def _write_bytes(self, payload):
+        """
+        Hands an already-encoded and terminated payload to the backend.
+        Inheriting classes whose backends want something other than bytes in write() override this.
+        """
+        self.devcomm.write(payload)
 
 
     def write(self, command):
         """
         Send a command to the instrument, appending the instrument's preferred message termination characters.
+        Inside a batched_writes() block, the command is queued instead.
         """
-        self.devcomm.write(self.tobytes(command) + self.lineterminator) # Python3 strings default to Unicode, so need to be explicitly encoded
+        if self._wbuf is not None:
+            self._wbuf.append(command)
+            return
+        self._write_bytes(self._terminated(command))
         return
 
 
+    def write_many(self, commands):
+        """
+        Send a sequence of commands to the instrument in a single backend write, each one terminated
+        as write() would. Per-message overhead (syscalls, bus arbitration, VISA layers) usually
+        dwarfs the time spent actually transmitting a short command, so setup sequences like
+            for cmd in cmds:
+                inst.write(cmd)
+        are better off as inst.write_many(cmds).
+        """
+        self._write_bytes(b''.join([self._terminated(command) for command in commands]))
+
+
+    @contextmanager
+    def batched_writes(self):
+        """
+        Context manager which queues every write() issued inside its block and then sends them all
+        with one write_many() on the way out:
+            with inst.batched_writes():
+                inst.write('*RST')
+                inst.write('SENS:FUNC "VOLT"')
+        Only sensible for commands which don't expect a reply; an ask() inside the block would be
+        left waiting for a response to a command that hasn't been sent yet.
+        """
+        if self._wbuf is not None: # Already batching, so just fold into the outer block
+            yield self
+            return
+        self._wbuf = []
+        try:
+            yield self
+        finally:
+            queued, self._wbuf = self._wbuf, None
+            if queued:
+                self.write_many(queued)
+
+
     def read(self):
         """
         Read a response from the instrument and return it sans
@@ -134,6 +296,101 @@ class CommBasics(object):
         return self.read()
 
 
+    def ask_cached(self, command, ttl=1.0):
+        """
+        As ask(), but reuses the response to the same command for up to ttl seconds.
+        Only for idempotent queries (*IDN?, range/configuration queries, etc.) whose answers
+        can't change behind our backs; call invalidate_ask_cache() after writes that could change them.
+        """
+        now = time.monotonic()
+        cached = self._ask_cache.get(command)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        response = self.ask(command)
+        self._ask_cache[command] = (now + ttl, response)
+        return response
+
+
+    def invalidate_ask_cache(self, prefix=None):
+        """
+        Forget cached ask_cached() responses: all of them, or only those for commands starting with prefix.
+        """
+        if prefix is None:
+            self._ask_cache.clear()
+        else:
+            for command in [thisCommand for thisCommand in self._ask_cache if thisCommand.startswith(prefix)]:
+                del self._ask_cache[command]
+
+
+    def ask_array(self, command, dtype='<f4'):
+        """
+        Send a query whose response is an IEEE-488.2 definite-length binary block--'#', one digit n,
+        n digits giving the payload length, then the payload--and return the payload as a NumPy array
+        of the given dtype. np.frombuffer() does the conversion, so there's no Python-level parsing
+        of trace or buffer readouts at all.
+        """
+        self.write(command)
+        header = self._read_bytes(2)
+        if header[0:1]!=b'#' or not header[1:2].isdigit() or header[1:2]==b'0':
+            raise Instrument_Generic_Exception(type(self).__name__, f"Expected a definite-length binary block header, got {header!r}")
+        length = int(self._read_bytes(int(header[1:2])))
+        payload = self._read_bytes(length)
+        self._read_bytes(len(self.readterminator))
+        return np.frombuffer(payload, dtype=dtype)
+
+
+    def _read_bytes(self, count):
+        """
+        Reads exactly count bytes, as raw bytes, for ask_array(). Assumes a PySerial-like read(size);
+        inheriting classes with other backends override this.
+        """
+        data = b''
+        while len(data) < count:
+            chunk = self.devcomm.read(count - len(data))
+            if not chunk: # Timed out
+                raise Instrument_Generic_Exception(type(self).__name__, f"Timed out after {len(data)} of {count} expected bytes")
+            data += self.tobytes(chunk)
+        return data
+
+
+    def ask_async(self, command):
+        """
+        Submit a response-expected command to a background thread and immediately return a
+        concurrent.futures.Future for the response, so that queries to several instruments can overlap:
+            futures = [inst.ask_async('MEAS?') for inst in instruments]
+            readings = [future.result() for future in futures]
+        Transactions on the same instrument are still run one at a time, but don't mix these
+        with plain ask() calls on that instrument while any are in flight.
+        """
+        with CommBasics._askpoollock:
+            if CommBasics._askpool is None:
+                CommBasics._askpool = ThreadPoolExecutor(thread_name_prefix='InstrumentComm')
+        return CommBasics._askpool.submit(self._locked_ask, command)
+
+
+    def _locked_ask(self, command):
+        with self._asklock:
+            return self._ask_when_ready(command)
+
+
+    def _ask_when_ready(self, command):
+        """
+        The transaction ask_async() runs in its worker thread. By default just ask(), but inheriting
+        classes whose backends offer a status byte can override this to poll for the response.
+        """
+        return self.ask(command)
+
+
+    def _wait_for_MAV(self):
+        """
+        Polls the instrument's IEEE-488.2 status byte until its Message AVailable bit (bit 4) is set,
+        giving up after fastTimeout so the subsequent read()'s own timeout can take over.
+        """
+        deadline = time.monotonic() + self.fastTimeout/1000
+        while not (self.devcomm.read_stb() & 0x10) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+
     def after_open(self):
         """
         Gives inheriting classes a chance to trigger any setup steps
@@ -149,54 +406,40 @@ class CommBasics(object):
     def tobytes(self, data):
         """
         Converts a string to bytes.
-        This function structure is essentially the longhand way [https://stackoverflow.com/a/45916896]
-        of getting the functionality of singledispatchmethod while preserving Python3 < 3.8 support.
-        tobytes() is the generic version for data types which are none of string, bytes, or bytearray
-        (so int, double, etc.)
+        Only three types matter here, so a straight type check is far cheaper than any dispatch machinery;
+        anything which is none of string, bytes, or bytearray (so int, double, etc.) goes through str() first.
 
         By the way, apparently the only difference between bytearray and bytes in Python3 is that
         the former is mutable and the latter is not. [https://stackoverflow.com/a/53754724]
         """
-        return str(data, self.byte_formatting).encode(self.byte_formatting)
-
-    def _bytes_tobytes(self, data:bytes):
-        return data
-
-    def _bytearray_tobytes(self, data:bytearray):
-        return data
-
-    def _str_tobytes(self, data:str):
-        return data.encode(self.byte_formatting)
+        if isinstance(data, (bytes, bytearray)):
+            return data
+        return (data if isinstance(data, str) else str(data)).encode(self.byte_formatting)
 
 
     def tostring(self, data):
         """
         Converts bytes to a string.
-        This function structure is essentially the longhand way [https://stackoverflow.com/a/45916896]
-        of getting the functionality of singledispatchmethod while preserving Python3 < 3.8 support.
-        tostring() is the generic version for data types which are not string.
+        bytes.decode() and bytearray.decode() are the same operation, so there's one branch;
+        str() is the identity on strings and covers everything else.
         """
+        if isinstance(data, (bytes, bytearray)):
+            return data.decode(self.byte_formatting) # [https://stackoverflow.com/q/14472650] says this is identical to str(data, 'utf-8'), but I like bytes.decode()
         return str(data)
 
-    def _bytes_tostring(self, data:bytes):
-        return data.decode(self.byte_formatting) # [https://stackoverflow.com/q/14472650] says this is identical to str(data, 'utf-8'), but I like bytes.decode()
-
-    def _bytearray_tostring(self, data:bytearray):
-        return str(data, self.byte_formatting)
-
-    def _str_tostring(self, data:str):
-        return data
-
 
 
 class Instrument_Generic_Exception(Exception):
     def __init__(self, instrumentType, errorMessage="I've made a huge mistake", proxyerror=None):
-        self.errorSite = inspect.stack()[1].function
+        frame = sys._getframe(1)
+        while frame.f_code.co_name=='__init__' and frame.f_locals.get('self') is self: # Skip over subclasses' __init__()s to the actual raise
+            frame = frame.f_back
+        self.errorSite = frame.f_code.co_name
         self.instrumentType = instrumentType
         if proxyerror==None or proxyerror==False: # The raising function probably caused the screwup
             self.proxyError = None
         elif proxyerror==True:
-            self.proxyError = inspect.stack()[2].function # Raising function, e.g., set()/get(), is just the messenger
+            self.proxyError = frame.f_back.f_code.co_name # Raising function, e.g., set()/get(), is just the messenger
         else:
             self.proxyError = str(proxyerror) # ...whatever you say, boss
         self.errorMessage = errorMessage
@@ -207,6 +450,18 @@ class Instrument_Generic_Exception(Exception):
 
 
 
+class Instrument_Labeled_Exception(Instrument_Generic_Exception):
+    """
+    Base for the per-interface exceptions, which differ only by their label:
+    subclasses just set the class attribute instrumentType.
+    """
+    instrumentType = 'Generic'
+
+    def __init__(self, errorMessage='', proxyerror=None):
+        super(Instrument_Labeled_Exception, self).__init__(self.instrumentType, errorMessage, proxyerror)
+
+
+
 
 # GPIB
 
@@ -220,13 +475,7 @@ class GPIB(CommBasics):
         super(GPIB, self).__init__(terminator=terminator, readterminator=readterminator, **kwargs)
         self.stdTimeout = 2000 # [msec] default timeout length
         self.fastTimeout = 200 # [msec] timeout for routine things such as read()s
-        self.knownGPIBaddrs = []
-        if knownGPIBaddrs!=None:
-            try:
-                len(knownGPIBaddrs) # Solely to trip the exception for non-arrays
-                self.knownGPIBaddrs = knownGPIBaddrs
-            except TypeError:
-                self.knownGPIBaddrs = [knownGPIBaddrs]
+        self.knownGPIBaddrs = _as_list(knownGPIBaddrs)
 
     def __del__(self):
         try:
@@ -246,14 +495,11 @@ class GPIB(CommBasics):
         if commaddr==None:
             tryports = self.knownGPIBaddrs
         else:
-            try:
-                tryports = commaddr + self.knownGPIBaddrs
-            except TypeError: # commaddr must have been a single int, not a list
-                tryports = [commaddr] + self.knownGPIBaddrs
-        rm = visa.ResourceManager() # For PyVISA 1.5+ [http://pyvisa.readthedocs.org/en/latest/migrating.html]
-        instrList = ''.join(rm.list_resources())
+            tryports = _as_list(commaddr) + self.knownGPIBaddrs
+        rm = get_resourcemanager()
+        foundaddrs = {int(match.group(1)) for match in map(GPIB_RESOURCE_REGEX.match, list_resources()) if match} # A substring search would find '1' in 'GPIB0::12::INSTR'
         for tryport in tryports:
-            if str(tryport) in instrList:
+            if int(tryport) in foundaddrs:
                 try:
                     self.devcomm = rm.open_resource('GPIB::' + str(tryport) + '::INSTR', open_timeout=self.stdTimeout) # [http://pyvisa.readthedocs.io/en/stable/api/resourcemanager.html#pyvisa.highlevel.ResourceManager.open_resource]; WARNING: does not include GPIB board identifier block
                     self.devcomm.timeout = self.fastTimeout # [http://pyvisa.readthedocs.io/en/stable/api/resources.html#pyvisa.resources.Resource.timeout]
@@ -271,20 +517,56 @@ class GPIB(CommBasics):
         self.devcomm.close()
 
 
+    def _write_bytes(self, payload):
+        """
+        PyVISA's write() wants a string and adds its own termination, so bytes go through write_raw().
+        """
+        self.devcomm.write_raw(payload)
+
+
     def ask(self, command):
         """
         Send a response-expected command to the instrument and return the response.
-        Wrapping here because PyVISA changed it to query(), then apparently to query_ascii_values()
+        PyVISA changed this to query(), then apparently to query_ascii_values()
         [https://pyvisa.readthedocs.io/en/latest/api/resources.html#pyvisa.resources.USBRaw.query_ascii_values],
-        and because PrologixGPIB and RS232 all have differing methods.
+        which parses the whole payload into a list of Python floats--painfully slow for large
+        returns, and not a string anyway--so we write and read_raw() the bytes ourselves.
         """
-        response = self.tostring(self.devcomm.query_ascii_values(command)).strip(self.tostring(self.lineterminator))
+        self.devcomm.write(command) # PyVISA appends its own termination here
+        response = self.tostring(self.devcomm.read_raw()).rstrip(self._lineterm_str)
         return response
 
 
-class Instrument_GPIB_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_GPIB_Error, self).__init__('GPIB', errorMessage, proxyerror)
+    def ask_binary(self, command, datatype='f', is_big_endian=False):
+        """
+        Send a query whose response is an IEEE-488.2 binary block, e.g. a trace or buffer readout,
+        and return it as a NumPy array. Argument datatype is a struct module format character
+        ('f' for float32, 'd' for float64, 'h' for int16, etc.) [https://docs.python.org/3/library/struct.html#format-characters]
+        The decoding happens in PyVISA/NumPy rather than in a Python-level parse.
+        """
+        return self.devcomm.query_binary_values(command, datatype=datatype, is_big_endian=is_big_endian, container=np.array)
+
+
+    def ask_array(self, command, dtype='<f4'):
+        """
+        Overrides CommBasics.ask_array() to let PyVISA's query_binary_values() handle the block.
+        """
+        dtype = np.dtype(dtype)
+        bigendian = dtype.byteorder=='>' or (dtype.byteorder=='=' and sys.byteorder=='big')
+        return self.ask_binary(command, datatype=STRUCT_FORMATS[(dtype.kind, dtype.itemsize)], is_big_endian=bigendian).astype(dtype, copy=False)
+
+
+    def _ask_when_ready(self, command):
+        """
+        For ask_async(): write, poll the status byte rather than blocking in a read, then read.
+        """
+        self.devcomm.write(command) # PyVISA appends its own termination here
+        self._wait_for_MAV()
+        return self.tostring(self.devcomm.read()).strip(self._lineterm_str)
+
+
+class Instrument_GPIB_Error(Instrument_Labeled_Exception):
+    instrumentType = 'GPIB'
 
 
 
@@ -304,13 +586,7 @@ class PrologixGPIB(CommBasics):
             raise Instrument_PrologixGPIB_Error("Import error.\n  Is the file 'prologix_GPIB.py' around?", e)
         self.stdTimeout = 2000 # [msec] default timeout length
         self.fastTimeout = 200 # [msec] timeout for routine things such as read()s
-        self.knownGPIBaddrs = []
-        if knownGPIBaddrs!=None:
-            try:
-                len(knownGPIBaddrs) # Solely to trip the exception for non-arrays
-                self.knownGPIBaddrs = knownGPIBaddrs
-            except TypeError:
-                self.knownGPIBaddrs = [knownGPIBaddrs]
+        self.knownGPIBaddrs = _as_list(knownGPIBaddrs)
 
     def __del__(self):
         try:
@@ -338,7 +614,7 @@ class PrologixGPIB(CommBasics):
         [https://pyvisa.readthedocs.io/en/latest/api/resources.html#pyvisa.resources.USBRaw.query_ascii_values],
         and because PrologixGPIB and RS232 all have differing methods.
         """
-        response = self.tostring(self.devcomm.ask(command)).strip(self.tostring(self.lineterminator))
+        response = self.tostring(self.devcomm.ask(command)).strip(self._lineterm_str)
         return response
 
 
@@ -346,9 +622,8 @@ class PrologixGPIB(CommBasics):
         self.devcomm.close()
 
 
-class Instrument_PrologixGPIB_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_PrologixGPIB_Error, self).__init__('PrologixGPIB', errorMessage, proxyerror)
+class Instrument_PrologixGPIB_Error(Instrument_Labeled_Exception):
+    instrumentType = 'PrologixGPIB'
 
 
 
@@ -364,8 +639,7 @@ class VISA(CommBasics):
         to try and tiptoe around these issues.
         """
         super(VISA, self).__init__(terminator=terminator, readterminator=readterminator)
-        if not sys.platform=='win32':
-            visa.ResourceManager('@py') # To select the pure-Python pyvisa-py backend [https://pyvisa.readthedocs.io/en/latest/introduction/configuring.html]
+        self.visabackend = '' if sys.platform=='win32' else '@py' # To select the pure-Python pyvisa-py backend [https://pyvisa.readthedocs.io/en/latest/introduction/configuring.html]
         self.stdTimeout = 2000 # [msec] default timeout length
         self.fastTimeout = 200 # [msec] timeout for routine things such as read()s
 
@@ -382,17 +656,17 @@ class VISA(CommBasics):
         Open VISA communications. Argument inVISAstring should be a string that would appear
         in the desired instrument's VISA identifier; it should be specific enough to reliably identify the instrument.
         """
-        rm = visa.ResourceManager()
-        instrList = rm.list_resources()
+        rm = get_resourcemanager(self.visabackend)
+        instrList = list_resources(self.visabackend)
         matchingInstrs = [thisInstr for thisInstr in instrList if str(inVISAstring) in thisInstr] # [https://stackoverflow.com/a/4843172]
         if len(matchingInstrs)==0:
-            raise Instrument_VISA_Error(f"Specified VISA string '{vendorIDorVISAstring}' not detected as present.\n    Please check string and try again.")
+            raise Instrument_VISA_Error(f"Specified VISA string '{inVISAstring}' not detected as present.\n    Please check string and try again.")
         elif len(matchingInstrs) > 1:
-            raise Instrument_VISA_Error(f"Specified VISA string '{vendorIDorVISAstring}' detected in more than one instrument.\n    Please be more specific.")
+            raise Instrument_VISA_Error(f"Specified VISA string '{inVISAstring}' detected in more than one instrument.\n    Please be more specific.")
         else:
             self.devcomm = rm.open_resource(matchingInstrs[0], open_timeout=self.stdTimeout) # [http://pyvisa.readthedocs.io/en/stable/api/resourcemanager.html#pyvisa.highlevel.ResourceManager.open_resource]
-            self.devcomm.write_termination = '' # PyVISA has its own layer [https://pyvisa.readthedocs.io/en/latest/introduction/resources.html?highlight=read_termination#termination-characters]
-            self.devcomm.read_termination = ''
+            self.devcomm.write_termination = self._lineterm_str # PyVISA's own layer appends these at the driver [https://pyvisa.readthedocs.io/en/latest/introduction/resources.html?highlight=read_termination#termination-characters]
+            self.devcomm.read_termination = self.tostring(self.readterminator)
         # Finally, check the instrument we've opened for
         if IDcheck is not None:
             return IDcheck()
@@ -406,27 +680,61 @@ class VISA(CommBasics):
 
     def write(self, command):
         """
-        Send a command to the instrument, appending the instrument's preferred message termination characters.
+        Send a command to the instrument; PyVISA's write_termination supplies the termination characters.
         Apparently PyVISA still wants strings...
         """
-        self.devcomm.write(self.tostring(command) + self.tostring(self.lineterminator)) # Python3 strings default to Unicode, so need to be explicitly encoded
+        if self._wbuf is not None:
+            self._wbuf.append(command)
+            return
+        self.devcomm.write(self.tostring(command))
         return
 
+    def _write_bytes(self, payload):
+        """
+        PyVISA's write() wants a string, so write_many()'s already-terminated bytes go through write_raw(),
+        which doesn't apply write_termination.
+        """
+        self.devcomm.write_raw(payload)
+
     def ask(self, command):
         """
         Send a response-expected command to the instrument and return the response.
-        Wrapping here because PyVISA changed it to query(), then apparently to query_ascii_values()
+        PyVISA changed this to query(), then apparently to query_ascii_values()
         [https://pyvisa.readthedocs.io/en/latest/api/resources.html#pyvisa.resources.USBRaw.query_ascii_values],
         and finally decided it ought to parse everything to a float by default
-        [https://pyvisa.readthedocs.io/en/latest/api/resources.html?highlight=query#pyvisa.resources.USBRaw.query_ascii_values].
+        [https://pyvisa.readthedocs.io/en/latest/api/resources.html?highlight=query#pyvisa.resources.USBRaw.query_ascii_values];
+        even with the 's' converter that's a Python-level pass over the payload, so we write and read_raw() instead.
         """
-        response = self.tostring(self.devcomm.query_ascii_values(command, 's')).strip(self.tostring(self.lineterminator))
+        self.write(command)
+        response = self.tostring(self.devcomm.read_raw()).rstrip(self._lineterm_str)
         return response
 
+    def ask_binary(self, command, datatype='f', is_big_endian=False):
+        """
+        Send a query whose response is an IEEE-488.2 binary block and return it as a NumPy array;
+        see GPIB.ask_binary() for the datatype codes.
+        """
+        return self.devcomm.query_binary_values(self.tostring(command), datatype=datatype, is_big_endian=is_big_endian, container=np.array)
+
+    def ask_array(self, command, dtype='<f4'):
+        """
+        Overrides CommBasics.ask_array() to let PyVISA's query_binary_values() handle the block.
+        """
+        dtype = np.dtype(dtype)
+        bigendian = dtype.byteorder=='>' or (dtype.byteorder=='=' and sys.byteorder=='big')
+        return self.ask_binary(command, datatype=STRUCT_FORMATS[(dtype.kind, dtype.itemsize)], is_big_endian=bigendian).astype(dtype, copy=False)
 
-class Instrument_VISA_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_VISA_Error, self).__init__('VISA', errorMessage, proxyerror)
+    def _ask_when_ready(self, command):
+        """
+        For ask_async(): write, poll the status byte rather than blocking in a read, then read.
+        """
+        self.write(command)
+        self._wait_for_MAV()
+        return self.tostring(self.devcomm.read()).strip(self._lineterm_str)
+
+
+class Instrument_VISA_Error(Instrument_Labeled_Exception):
+    instrumentType = 'VISA'
 
 
 
@@ -510,10 +818,8 @@ class USBTMC(CommBasics):
                 foundproductID = matchingDevs[0].idProduct
                 self.devcomm = self.PyUSBTMC.Instrument(foundvendorID, foundproductID) # Further filtering by serial number [https://github.com/python-ivi/python-usbtmc] is not a concern until the lab has two of any instrument
             except self.PyUSBTMC.usbtmc.UsbtmcException as e:
-                print(e) # diagnostics
-                print(hex(vendorIDorVISAstring)) # diagnostics
-                print(hex(productID)) # diagnostics
-                raise Instrument_USBTMC_Error(f"Error opening USB device '{hex(vendorIDorVISAstring)}:{hex(productID)}'\n", e)
+                logger.debug("USBTMC open of %s:%s failed: %s", hex(foundvendorID), hex(foundproductID), e)
+                raise Instrument_USBTMC_Error(f"Error opening USB device '{hex(foundvendorID)}:{hex(foundproductID)}'\n", e)
         # Check the device we've opened
         if IDcheck is not None:
             return IDcheck()
@@ -530,13 +836,20 @@ class USBTMC(CommBasics):
         Send a response-expected command to the instrument and return the response.
         Python-USBTMC stills calls this ask(), unlike PyVISA's rebranding to query_*().
         """
-        response = str(self.devcomm.ask(command)).strip(self.tostring(self.lineterminator))
-        return response
+        return self.devcomm.ask(command).rstrip(self._lineterm_str) # Already a str, and the terminator only ever trails
 
 
-class Instrument_USBTMC_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_USBTMC_Error, self).__init__('USBTMC', errorMessage, proxyerror)
+    def _ask_when_ready(self, command):
+        """
+        For ask_async(): python-usbtmc exposes read_stb() too, so poll it between the write and the read.
+        """
+        self.devcomm.write(command)
+        self._wait_for_MAV()
+        return self.devcomm.read().rstrip(self._lineterm_str)
+
+
+class Instrument_USBTMC_Error(Instrument_Labeled_Exception):
+    instrumentType = 'USBTMC'
 
 
 
@@ -556,18 +869,13 @@ class RS232(CommBasics):
         self.pyserial = serial
         self.stdTimeout = 2000 # [msec] default timeout length
         self.fastTimeout = 200 # [msec] timeout for routine things such as read()s
-        self.knownRS232addrs = [] # TODO kept for call compatibility, but maybe serial shouldn't have these...
-        if knownRS232addrs!=None:
-            try:
-                len(knownRS232addrs) # Solely to trip the exception for non-arrays
-                self.knownRS232addrs = knownRS232addrs
-            except TypeError:
-                self.knownRS232addrs = [knownRS232addrs]
+        self.lowLatency = True # Ask Linux to drop USB-serial adapters' (usually 16 ms) latency timer at open
+        self.knownRS232addrs = _as_list(knownRS232addrs) # TODO kept for call compatibility, but maybe serial shouldn't have these...
         self.RS232params = {'timeout': self.stdTimeout/1000, 'write_timeout': self.stdTimeout/1000}
-        self.pyserialparams = ['port', 'baudrate', 'bytesize', 'parity', 'stopbits', 'xonxoff', 'rtscts', 'dsrdtr', 'inter_byte_timeout', 'exclusive'] # [https://pyserial.readthedocs.io/en/latest/pyserial_api.html]
-        self.RS232params.update({kw: arg for kw, arg in kwargs.items() if kw in self.pyserialparams}) # Store any additional parameters recognized as serial parameters
-        print("RS232params: {!s}".format(self.RS232params)) # diagnostics
-        print("knownRS232addrs: {!s}".format(self.knownRS232addrs)) # diagnostics
+        self.pyserialparams = frozenset(['port', 'baudrate', 'bytesize', 'parity', 'stopbits', 'xonxoff', 'rtscts', 'dsrdtr', 'inter_byte_timeout', 'exclusive']) # [https://pyserial.readthedocs.io/en/latest/pyserial_api.html]
+        self.RS232params.update(self._serialkwargs(kwargs)) # Store any additional parameters recognized as serial parameters
+        logger.debug("RS232params: %s", self.RS232params)
+        logger.debug("knownRS232addrs: %s", self.knownRS232addrs)
 
     def __del__(self):
         try:
@@ -592,11 +900,12 @@ class RS232(CommBasics):
             tryports = self.knownRS232addrs
         else:
             tryports = [commaddr] + self.knownRS232addrs
-        serialparams = self.RS232params
-        serialparams.update({kw: arg for kw, arg in kwargs.items() if kw in self.pyserialparams}) # Store any additional parameters recognized as serial parameters
+        serialparams = {**self.RS232params, **self._serialkwargs(kwargs)} # A fresh dict, so one-off parameters here don't stick to the defaults
         for tryport in tryports:
             try:
                 self.devcomm = self.pyserial.Serial(tryport, **serialparams)
+                if self.lowLatency:
+                    self.set_low_latency()
                 if IDcheck is not None:
                     return IDcheck()
             except (self.pyserial.SerialException, AttributeError) as e:
@@ -607,24 +916,47 @@ class RS232(CommBasics):
         raise Instrument_RS232_Error("No instrument detected at addresses {}!".format(tryports))
 
 
+    def _serialkwargs(self, kwargs):
+        """
+        Filters a kwargs dict down to the entries PySerial would recognize.
+        """
+        return {kw: arg for kw, arg in kwargs.items() if kw in self.pyserialparams}
+
+
     def closeport(self):
         self.devcomm.close()
 
 
+    def set_low_latency(self, enable=True):
+        """
+        Sets (or clears) the Linux ASYNC_LOW_LATENCY flag on the open port, via the TIOCGSERIAL/TIOCSSERIAL
+        ioctl pair that PySerial wraps as set_low_latency_mode(). FTDI and similar USB-serial adapters
+        otherwise sit on short responses for their full latency timer, typically 16 ms.
+        Returns whether the flag could be set; ports and drivers that don't support it are left alone.
+        """
+        try:
+            self.devcomm.set_low_latency_mode(enable) # Only exists on Linux [https://pyserial.readthedocs.io/en/latest/pyserial_api.html#serial.Serial.set_low_latency_mode]
+        except (AttributeError, ValueError, OSError):
+            return False
+        return True
+
+
     def read(self):
         """
         Read a response from the instrument and return it
         sans the instrument's preferred message termination characters.
         PySerial offers read_until(), which is convenient.
+        The terminator is sliced off the bytes before the one and only decode.
         """
-        response = self.tostring(self.devcomm.read_until(self.readterminator)).strip(self.tostring(self.lineterminator)) # [https://stackoverflow.com/a/58329177]
-        return response
+        response = self.devcomm.read_until(self.readterminator) # [https://stackoverflow.com/a/58329177]
+        if response.endswith(self.lineterminator):
+            response = response[:-len(self.lineterminator)]
+        return response.decode(self.byte_formatting)
 
 
 
-class Instrument_RS232_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_RS232_Error, self).__init__('RS-232', errorMessage, proxyerror)
+class Instrument_RS232_Error(Instrument_Labeled_Exception):
+    instrumentType = 'RS-232'
 
 
 
@@ -633,8 +965,21 @@ class Instrument_RS232_Error(Instrument_Generic_Exception):
 
 # RS-485 serial
 
+def _log_failed_write(future):
+    """
+    Done-callback for RS485's fire-and-forget writes, whose Futures nobody else holds.
+    """
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"RS485 write failed: {future.exception()!r}")
+
+
+
 class RS485(CommBasics):
 
+    ENUM_CACHE_TTL = 3 # [sec] how long a libftdi device enumeration is trusted before rescanning the USB bus
+    _enum_cache = (None, []) # (time.monotonic() stamp, list of [vendor, product, serial] triples), shared by all instances
+    _enum_lock = threading.Lock()
+
     def __init__(self, adapter_serial=None, terminator='\r\n', readterminator='\r\n', **kwargs):
         """
         Communicate with an instrument over RS-485.
@@ -648,13 +993,20 @@ class RS485(CommBasics):
         self.pylibftdi = pylibftdi
         self.stdTimeout = 2000 # [msec] default timeout length
         self.fastTimeout = 200 # [msec] timeout for routine things such as read()s
-        self.pauseTime = 0.01 # [msec] some adapters/devices seem to be a tad slow
+        self.pauseTime = None # [sec] fixed wait before reading responses, for any adapters/devices too slow for read()'s polling
+        self.readChunk = 4096 # [bytes] per libftdi read call; one bulk USB transfer instead of readline()'s one per byte
+        self._rxbuf = bytearray() # Received bytes not yet returned by read(), e.g. the start of the next response
+        self.useIOThread = True # Whether openRS485port() hands the adapter to a dedicated I/O thread
+        self._ioqueue = None # queue.Queue of (payload bytes or None, Future, reader) for the I/O thread; see _submit_io()
+        self._iothread = None
 
         self.serialparams = {'timeout': self.stdTimeout/1000, 'write_timeout': self.stdTimeout/1000}
         self.serialparams.update(kwargs) # Store any additional parameters
 
     def __del__(self):
         try:
+            if self._ioqueue is not None:
+                self._ioqueue.put(None) # Lets the I/O thread exit; no join(), as this may be running on that very thread
             self.devcomm.close()
         except Exception:
             pass
@@ -665,15 +1017,64 @@ class RS485(CommBasics):
         Open communications via RS-485.
         Backend pylibftdi offers much fewer built-in configuration parameters
         (referring most instead to the underlying libftdi calls)
-        so we're just ignoring self.serialparams for now.
+        so self.serialparams is consulted only for 'baudrate', 'latency_ms'
+        (the adapter's latency timer, default 1 ms), and 'write_chunksize' (default 4096 bytes).
+        """
+        libftdi_devs, cached = self._list_adapters()
+        try:
+            self._open_adapter(adapter_serial, libftdi_devs)
+        except Instrument_RS485_Error:
+            self.invalidate_enum_cache()
+            if not cached:
+                raise
+            self._open_adapter(adapter_serial, self._list_adapters()[0]) # The adapters may have changed since the enumeration we trusted
+        if 'baudrate' in self.serialparams and self.serialparams['baudrate'] is not None:
+            self.devcomm.baudrate = self.serialparams['baudrate']
+        self.devcomm.ftdi_fn.ftdi_set_latency_timer(self.serialparams.get('latency_ms', 1)) # [msec] rather than the default 16, so short responses are flushed to us promptly
+        self.devcomm.ftdi_fn.ftdi_read_data_set_chunksize(self.readChunk) # ftdi_fn supplies the context argument itself
+        self.devcomm.ftdi_fn.ftdi_write_data_set_chunksize(self.serialparams.get('write_chunksize', 4096))
+        self._rxctypes = (ctypes.c_ubyte * self.readChunk)() # Reused by every read(), which libftdi fills directly
+        self._rxbuf.clear()
+        if self.useIOThread:
+            self._start_io_thread()
+        if IDcheck is not None:
+            return IDcheck()
+        return self.after_open()
+
+
+    @classmethod
+    def invalidate_enum_cache(cls):
+        """
+        Forget the cached libftdi enumeration, so the next openRS485port() rescans the USB bus.
+        """
+        with cls._enum_lock:
+            RS485._enum_cache = (None, [])
+
+
+    def _list_adapters(self):
+        """
+        Returns (list of [vendor, product, serial] triples, whether it came from the cache).
+        Driver().list_devices() walks the whole USB bus, so it's only repeated after ENUM_CACHE_TTL.
+        """
+        with self._enum_lock:
+            stamp, libftdi_devs = RS485._enum_cache
+            if stamp is not None and time.monotonic() - stamp < self.ENUM_CACHE_TTL:
+                return libftdi_devs, True
+            libftdi_devs = self.pylibftdi.Driver().list_devices()
+            RS485._enum_cache = (time.monotonic(), libftdi_devs)
+            return libftdi_devs, False
+
+
+    def _open_adapter(self, adapter_serial, libftdi_devs):
+        """
+        Open adapter_serial, or else the first of libftdi_devs that works, as self.devcomm.
         """
-        libftdi_devs = self.pylibftdi.Driver().list_devices() # List of triples: [vendor, product, serial]
         found_serials = [founddev[2] for founddev in libftdi_devs]
         if len(libftdi_devs)==0:
             raise Instrument_RS485_Error(f"libftdi could not find any RS-485 USB adapters!")
         elif adapter_serial in found_serials:
             try:
-                self.devcomm = self.pylibftdi.Device(device_ID=adapter_serial, mode='t')
+                self.devcomm = self.pylibftdi.Device(device_ID=adapter_serial, mode='b')
             except AttributeError as e: # TODO check list of targeted exceptions
                 raise Instrument_RS485_Error(f"RS-485 USB adapter with serial '{adapter_serial}' detected, but error on connection attempt: ", e)
         elif adapter_serial!=None:
@@ -681,45 +1082,217 @@ class RS485(CommBasics):
         else: # Okay, just glom onto the first one that works
             for found_serial in found_serials:
                 try:
-                    self.devcomm = self.pylibftdi.Device(device_ID=found_serial, mode='t')
+                    self.devcomm = self.pylibftdi.Device(device_ID=found_serial, mode='b')
                     break
                 except AttributeError as e: # TODO check list of targeted exceptions
                     pass
             else:
                 raise Instrument_RS485_Error(f"Tried {len(found_serials)} found RS-485 USB adapters, but none successfully opened!")
-        if 'baudrate' in self.serialparams and self.serialparams['baudrate'] is not None:
-            self.devcomm.baudrate = self.serialparams['baudrate']
-        if IDcheck is not None:
-            return IDcheck()
-        return self.after_open()
 
 
     def closeport(self):
-        self.devcomm.close()
+        if self._stop_io_thread():
+            self.devcomm.close()
+        else: # Closing the adapter out from under a read in progress could crash libftdi
+            logger.warning(f"RS485 I/O thread still busy after {self.stdTimeout} ms; leaving the adapter open.")
+
+
+    def _start_io_thread(self):
+        """
+        From here on, only the I/O thread touches self.devcomm; write(), read(), and ask() queue
+        their transactions to it, so a GUI thread waiting on an instrument can be handed a Future
+        (see ask_async()) instead of blocking for the whole round trip.
+        """
+        self._stop_io_thread()
+        self._ioqueue = queue.Queue()
+        # The thread only gets a weak reference, so it doesn't keep the instance (and its adapter) alive forever
+        self._iothread = threading.Thread(target=RS485._serve_io, args=(self._ioqueue, weakref.ref(self)), name=f'RS485-{id(self):x}', daemon=True)
+        self._iothread.start()
+
+
+    def _stop_io_thread(self):
+        """
+        Asks the I/O thread to finish what's queued and exit, waiting up to stdTimeout;
+        returns whether it has (or there was none), i.e. whether self.devcomm is free.
+        """
+        if self._iothread is not None:
+            self._ioqueue.put(None) # Sentinel: finish what's queued, then exit
+            self._iothread.join(self.stdTimeout/1000)
+            if self._iothread.is_alive():
+                return False
+            self._iothread = self._ioqueue = None
+        return True
+
+
+    @staticmethod
+    def _serve_io(ioqueue, instanceref):
+        """
+        The I/O thread's loop. Holds its RS485 instance only through instanceref, and only while
+        running a job, so an instance nobody else references can still be collected (and closed).
+        """
+        while True:
+            job = ioqueue.get()
+            if job is None:
+                return
+            payload, future, reader = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            instance = instanceref()
+            if instance is None:
+                future.set_exception(Instrument_RS485_Error("RS485 instance was deleted with transactions still queued"))
+                continue
+            try:
+                if payload is not None:
+                    instance.devcomm.write(payload)
+                    if reader is not None and instance.pauseTime:
+                        time.sleep(instance.pauseTime)
+                future.set_result(reader[0](instance, *reader[1:]) if reader is not None else None)
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                del instance # Not held while waiting on the queue
+
+
+    def _await_io(self, future):
+        """
+        Waits for a transaction queued by _submit_io(), but no longer than its own read could take plus
+        fastTimeout's grace (so a read giving up on its own returns first), cancelling it if it never started.
+        """
+        try:
+            return future.result(timeout=(self.stdTimeout + self.fastTimeout)/1000)
+        except FutureTimeoutError:
+            future.cancel()
+            raise Instrument_RS485_Error(f"RS485 transaction still queued or running after {self.stdTimeout + self.fastTimeout} ms")
+
+
+    def _submit_io(self, payload, reader=None):
+        """
+        Queues a transaction to the I/O thread and returns its Future: payload (if not None) is written,
+        then reader (if not None), a tuple of an unbound RS485 method and any further arguments, is
+        called on the instance in the I/O thread, and its return value becomes the Future's result.
+        """
+        future = Future()
+        self._ioqueue.put((payload, future, reader))
+        return future
+
+
+    def _write_bytes(self, payload):
+        """
+        Writes go through the I/O thread when there is one; they're fire-and-forget,
+        but queue order keeps them ahead of any later ask(), and any failure is logged.
+        """
+        if self._iothread is None:
+            self.devcomm.write(payload)
+        else:
+            self._submit_io(payload).add_done_callback(_log_failed_write)
 
 
     def read(self):
         """
         Read a response from the instrument and return it
         sans the instrument's preferred message termination characters.
-        pylibftdi's read() requires a length in bytes to be specified, but
-        the module also offers readline().
         """
-        response = self.tostring(self.devcomm.readline()).strip(self.tostring(self.lineterminator)) # [https://stackoverflow.com/a/58329177]
-        return response
+        if self._iothread is None:
+            return self._read_frame()
+        return self._await_io(self._submit_io(None, (RS485._read_frame,)))
+
+
+    def _read_frame(self):
+        """
+        The actual work of read().
+        pylibftdi's readline() reads a byte at a time [https://stackoverflow.com/a/58329177],
+        so instead have libftdi read in bulk into self._rxbuf, and split off one terminated response,
+        keeping anything after it for next time. Gives up after stdTimeout,
+        returning whatever partial response has arrived.
+        """
+        term = self.readterminator
+        deadline = time.monotonic() + self.stdTimeout/1000
+        searchfrom = 0
+        while True:
+            idx = self._rxbuf.find(term, searchfrom)
+            if idx >= 0:
+                response = bytes(self._rxbuf[:idx])
+                del self._rxbuf[:idx+len(term)]
+                break
+            searchfrom = max(0, len(self._rxbuf) - len(term) + 1) # A terminator could straddle two chunks
+            if time.monotonic() > deadline:
+                response = bytes(self._rxbuf)
+                self._rxbuf.clear()
+                break
+            self._fill_rxbuf()
+        return response.strip(self.lineterminator).decode(self.byte_formatting)
+
+
+    def _fill_rxbuf(self):
+        """
+        One bulk libftdi read, appended to self._rxbuf; returns how many bytes arrived.
+        """
+        count = self.devcomm.ftdi_fn.ftdi_read_data(self._rxctypes, len(self._rxctypes)) # Skips pylibftdi's per-call buffer allocation [https://www.intra2net.com/en/developer/libftdi/documentation/group__libftdi.html]
+        if count < 0:
+            raise Instrument_RS485_Error(f"libftdi read failed with error code {count}")
+        elif count > 0:
+            self._rxbuf.extend(ctypes.string_at(self._rxctypes, count))
+        else:
+            time.sleep(0.001) # Nothing waiting yet; don't spin the CPU
+        return count
+
+
+    def _read_bytes(self, count):
+        """
+        Overrides CommBasics' version, for ask_array(): reads exactly count raw bytes, through the I/O thread
+        when there is one, and starting with whatever _read_frame() already pulled into self._rxbuf.
+        """
+        if self._iothread is None:
+            return self._read_exact(count)
+        return self._await_io(self._submit_io(None, (RS485._read_exact, count)))
+
+
+    def _read_exact(self, count):
+        """
+        The actual work of _read_bytes(). Gives up after stdTimeout, discarding the partial data.
+        """
+        deadline = time.monotonic() + self.stdTimeout/1000
+        while len(self._rxbuf) < count:
+            if time.monotonic() > deadline:
+                received = len(self._rxbuf)
+                self._rxbuf.clear()
+                raise Instrument_RS485_Error(f"Timed out after {received} of {count} expected bytes")
+            self._fill_rxbuf()
+        data = bytes(self._rxbuf[:count])
+        del self._rxbuf[:count]
+        return data
 
     def ask(self, command):
         """
         Send a response-expected command to the instrument and return the response.
-        This override is necessary because, at least with some devices and adapters,
-        there seems to be a slight delay between command issuance and response.
+        At least with some devices and adapters there's a slight delay between command issuance
+        and response; read() polls until the response arrives, so this normally returns as soon as
+        the device answers. Set pauseTime to reinstate a fixed wait for anything that needs it.
+        Refuses to run inside batched_writes(), where the command would just sit in the queue
+        while read() waited out stdTimeout.
         """
+        if self._wbuf is not None:
+            raise Instrument_RS485_Error(f"ask('{command}') inside batched_writes(); queued commands can't be answered until the block exits.")
+        if self._iothread is not None:
+            return self._await_io(self.ask_async(command))
         self.write(command)
-        time.sleep(self.pauseTime)
+        if self.pauseTime:
+            time.sleep(self.pauseTime)
         return self.read()
 
 
+    def ask_async(self, command):
+        """
+        With the I/O thread running, the transaction is simply queued to it, and its Future returned;
+        otherwise falls back to CommBasics.ask_async()'s shared pool. Refuses to run inside batched_writes(), as ask() does.
+        """
+        if self._wbuf is not None:
+            raise Instrument_RS485_Error(f"ask_async('{command}') inside batched_writes(); queued commands can't be answered until the block exits.")
+        if self._iothread is None:
+            return super(RS485, self).ask_async(command)
+        return self._submit_io(self._terminated(command), (RS485._read_frame,))
+
+
 
-class Instrument_RS485_Error(Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(Instrument_RS485_Error, self).__init__('RS-485', errorMessage, proxyerror)
+class Instrument_RS485_Error(Instrument_Labeled_Exception):
+    instrumentType = 'RS-485'
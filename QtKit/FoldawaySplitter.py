@@ -20,6 +20,9 @@ SOURCES, REFERENCES, AND EXAMPLES REFERRED TO
 
 
 MODIFICATION HISTORY
+[10/14/2026] Fold animations precompute their per-panel deltas once, rather than on every tick.
+			  Handle buttons carry their panel index, instead of each capturing a lambda.
+			  toggle() sums the destination sizes once rather than once per panel.
 [ 3/10/2022] Fixed jerky/interrupted FoldawaySplitter animations caused by minimum widget sizes.
 [12/31/2021] First version of FoldawaySplitter, a cousin of FoldawayPanel that subclasses QSplitter.
 			  It's themable, more stable, better at layout, but what did it cost?
@@ -74,7 +77,8 @@ class FoldawaySplitter(QtWidgets.QSplitter):
 		newhandle.handlePlusButton.setText("SHORT WORDS!")
 		newhandle.handlePlusButton.setCheckable(True)
 		newhandle.handlePlusButton.setChecked(True)
-		newhandle.handlePlusButton.clicked.connect(lambda: self.toggle(self.indexOf(newhandle))) # TODO what happens if we later remove or reorder the splitter's widgets?
+		newhandle.handlePlusButton.setProperty("panelIndex", -1) # Set for real by refreshPanelIndices() once the widget is in place
+		newhandle.handlePlusButton.clicked.connect(self._onHandleClicked)
 		newhandle.handlePlusLayout.addWidget(newhandle.handlePlusButton)
 		newhandle.setLayout(newhandle.handlePlusLayout)
 		return newhandle
@@ -88,6 +92,7 @@ class FoldawaySplitter(QtWidgets.QSplitter):
 		retval = QtWidgets.QSplitter.insertWidget(self, index, widget)
 		sizes.insert(index, 1)
 		self.setSizes(sizes)
+		self.refreshPanelIndices()
 		widget.setMinimumSize(1, 1) # Otherwise we'll have jerky animations
 		return retval
 
@@ -98,10 +103,30 @@ class FoldawaySplitter(QtWidgets.QSplitter):
 		sizes = [1 if prevsize > 0 else 0 for prevsize in self.sizes()]
 		retval = QtWidgets.QSplitter.addWidget(self, widget)
 		self.setSizes(sizes + [1])
+		self.refreshPanelIndices()
 		widget.setMinimumSize(1, 1) # Otherwise we'll have jerky animations
 		return retval
 
 
+	def refreshPanelIndices(self):
+		"""
+		Stores each handle's current index on its toggle button, for _onHandleClicked().
+		Needs calling after any change to the splitter's widgets, which insertWidget() and addWidget() do.
+		"""
+		for panelindex in range(self.count()):
+			handle = self.handle(panelindex)
+			if hasattr(handle, 'handlePlusButton'):
+				handle.handlePlusButton.setProperty("panelIndex", panelindex)
+
+	@QtCore.Slot()
+	def _onHandleClicked(self):
+		"""
+		Slot for every handle's toggle button; the button knows its own panel's index,
+		so there's no per-handle closure and no indexOf() search.
+		"""
+		self.toggle(self.sender().property("panelIndex"))
+
+
 	def labelPanel(self, panelindex, labeltext):
 		"""
 		Sets the text on a panel's expand/collapse button.
@@ -140,10 +165,15 @@ class FoldawaySplitter(QtWidgets.QSplitter):
 			self.destsizes[panelindex] = 1
 
 		self.destsizes[0] = 1 if sum(self.destsizes[1:])==0 else 0
-		self.destsizes = [int(totalsize * destsize/sum(self.destsizes)) for destsize in self.destsizes]
+		destsum = sum(self.destsizes) # Once, not once per panel
+		self.destsizes = [int(totalsize * destsize/destsum) for destsize in self.destsizes]
 		if self.prevsizes[panelindex]==self.destsizes[panelindex]:
 			self.setSizes(self.destsizes) # toggle() is also called to set up newly-added widgets
 		else:
+			# Everything onSizesChanged() needs that stays fixed for the whole animation
+			self._foldDeltas = [destsize - prevsize for destsize, prevsize in zip(self.destsizes, self.prevsizes)]
+			self._foldSpan = self._foldDeltas[panelindex]
+			self._foldSums = (sum(self.prevsizes), sum(self._foldDeltas))
 			self.foldAnimation.setStartValue(self.prevsizes[panelindex])
 			self.foldAnimation.setEndValue(self.destsizes[panelindex])
 			self.foldAnimation.start()
@@ -154,14 +184,9 @@ class FoldawaySplitter(QtWidgets.QSplitter):
 		"""
 		Slot which responds to the QVariantAnimation's valueChanged signals.
 		"""
-		try:
-			progress = (value - self.prevsizes[self.foldingpanelindex])/(self.destsizes[self.foldingpanelindex]-self.prevsizes[self.foldingpanelindex])
-		except ZeroDivisionError:
-			progress = 0 # A filthy cheat, yes
-		nowsizes = self.sizes()
-		totalsize = sum(nowsizes)
-		newsizes_frac = [self.prevsizes[i] + progress*(self.destsizes[i]-self.prevsizes[i]) for i in range(0, len(nowsizes))] # Scaling to actual size might not be necessary? But feels better
-		newsizes = [int(totalsize * newsize_frac/sum(newsizes_frac)) for newsize_frac in newsizes_frac]
+		progress = (value - self.prevsizes[self.foldingpanelindex])/self._foldSpan if self._foldSpan else 0 # A filthy cheat, yes
+		scale = sum(self.sizes())/(self._foldSums[0] + progress*self._foldSums[1]) # Scaling to actual size might not be necessary? But feels better
+		newsizes = [int(scale*(prevsize + progress*delta)) for prevsize, delta in zip(self.prevsizes, self._foldDeltas)]
 		newsizes[self.foldingpanelindex] = value
 		self.setSizes(newsizes)
 
@@ -20,6 +20,13 @@ SOURCES, REFERENCES, AND EXAMPLES REFERRED TO
 
 
 MODIFICATION HISTORY
+[10/14/2026] Repaints reuse the inner rectangle while it's still valid, and the text font while the radius and text length are.
+			  Paints directly onto the widget instead of via an offscreen QImage.
+			  setEndAngle() repaints only when the drawn, whole-degree arc actually changes.
+			  Gradient brushes are kept and just rotated by sweeps; fixed setGradientColors() not clearing solidColor.
+			  Setters coalesce their repaint requests into one per event loop pass.
+			  drawRing() refills one kept QPainterPath instead of allocating a new one per frame.
+			  drawRing()'s integer angles are computed by the setters, not per paint; added setTwelveOClock().
 [ 7/22/2022] Commented out the self.drawBackground() call to entirely eliminate the unnecessary backing square.
 [ 4/19/2022] Tiny tweaks to support PySide6. 
 [ 4/16/2022] Removed the "ringbearer" wrapper widget because it doesn't work, and isn't actually needed...
@@ -65,6 +72,15 @@ class QRoundBar(QtWidgets.QWidget):
 						
 		# Other styling
 		self.customBackground = None
+
+		# Paint-time caches, so repaints at animation frame rate don't reallocate everything
+		self._innerRectCache = None # (innerRect, innerRadius) from calculateInnerRect()
+		self._fontCacheKey = None # (innerRadius, len(text)) that self._fontCache was sized for
+		self._fontCache = None # The QFont sized for the current text
+		self._gradientBrush = None # The QConicalGradient built from gradientData; sweeps only rotate it
+		self._updatePending = False # Whether the setters' coalesced update() is already queued
+		self._ringPath = QtGui.QPainterPath() # Scratch path for drawRing(), refilled every frame
+		self._recalculateAngles() # drawRing()'s whole-degree startAngle and spanAngle, kept current by the setters
 		
 
 	# Make endAngle a custom property
@@ -72,49 +88,85 @@ class QRoundBar(QtWidgets.QWidget):
 		return self._endAngle
 
 	def setEndAngle(self, newval):
+		spanAngle = int(round(newval - self.beginAngle))
 		self._endAngle = newval
-		self.update() # Important: the key to the animation actually playing! [https://www.qtcentre.org/threads/59418-QPropertyAnimation-does-not-redraw-the-object]
+		if spanAngle!=self._cachedSpanAngle: # drawRing() only draws whole degrees, and many animation ticks would otherwise repaint identical pixels
+			self._cachedSpanAngle = spanAngle
+			self.update() # Important: the key to the animation actually playing! [https://www.qtcentre.org/threads/59418-QPropertyAnimation-does-not-redraw-the-object]
 
 	endAngle = QtCore.Property(float, getEndAngle, setEndAngle)
 
+	def _recalculateAngles(self):
+		"""
+		Converts twelveOClockIs, beginAngle, and endAngle to the integer angles drawRing() uses,
+		so that isn't redone on every paint. Anything changing those attributes should call this.
+		"""
+		self._cachedStartOffset = 90 + int(self.twelveOClockIs)
+		self._cachedStartAngle = self._cachedStartOffset - int(round(self.beginAngle))
+		self._cachedSpanAngle = int(round(self._endAngle - self.beginAngle))
+
+	def setTwelveOClock(self, angle):
+		self.twelveOClockIs = angle
+		self._recalculateAngles()
+		self._scheduleUpdate()
+
+	def _scheduleUpdate(self):
+		"""
+		The setters call this instead of update(), so configuring several properties in a row
+		costs one trip through update() on the next event loop pass rather than one per setter.
+		setEndAngle() still calls update() directly, since animation ticks are already paced.
+		"""
+		if not self._updatePending:
+			self._updatePending = True
+			QtCore.QTimer.singleShot(0, self._doUpdate)
+
+	def _doUpdate(self):
+		self._updatePending = False
+		self.update()
+
 	def setText(self, text):
 		self.text = text
-		self.update()
+		self._scheduleUpdate()
 
 	def getSweep(self):
 		return (self.beginAngle, self._endAngle)
 
 	def setSweep(self, beginAngle, endAngle):
 		self.beginAngle = beginAngle
+		self._recalculateAngles()
 		# self.endAngle = QtCore.QVariant(endAngle) # QVariant's .setValue() doesn't seem to be in PyQt5
 		self.setEndAngle(endAngle)
 		if self.solidColor==None:
 			self.rebuildBrush = True
-		self.update()
+		self._scheduleUpdate()
 
 	def setOutlinePenWidth(self, penWidth):
 		self.outlinePenWidth = penWidth
-		self.update()
+		self._innerRectCache = None # calculateInnerRect() depends on this for the 'line' style
+		self._scheduleUpdate()
 
 	def setDataPenWidth(self, penWidth):
 		self.dataPenWidth = penWidth
-		self.update()
+		self._scheduleUpdate()
 
 	def setGradientColors(self, stopPoints):
 		self.gradientData = stopPoints
-		self.solidcolor = None
+		self.solidColor = None
+		self._gradientBrush = None # New stops, so build from scratch
 		self.rebuildBrush = True
-		self.update()
+		self._scheduleUpdate()
 
 	def setSolidColor(self, hexARGB):
 		self.solidColor = hexARGB
 		self.gradientData = []
+		self._gradientBrush = None
 		self.rebuildBrush = True
-		self.update()
+		self._scheduleUpdate()
 
 	def setDonutThicknessRatio(self, val):
 		self.donutThicknessRatio = max(0., min(val, 1.))
-		self.update()
+		self._innerRectCache = None
+		self._scheduleUpdate()
 
 	def sizeHint(self):
 		"""
@@ -123,6 +175,10 @@ class QRoundBar(QtWidgets.QWidget):
 		"""
 		return QtCore.QSize(self.customsize[0], self.customsize[1])
 
+	def resizeEvent(self, event):
+		self._innerRectCache = None
+		super(QRoundBar, self).resizeEvent(event)
+
 	def paintEvent(self, event):
 		"""
 		The method called to actually do the drawing
@@ -130,25 +186,21 @@ class QRoundBar(QtWidgets.QWidget):
 		outerRadius = min(self.width(), self.height())
 		baseRect = QtCore.QRectF(1, 1, outerRadius-2, outerRadius-2)
 
-		buffer = QtGui.QImage(outerRadius, outerRadius, QtGui.QImage.Format_ARGB32)
-		buffer.fill(0)
-
-		p = QtGui.QPainter(buffer)
+		p = QtGui.QPainter(self) # Straight onto the widget, which Qt already double-buffers
 		p.setRenderHint(QtGui.QPainter.Antialiasing)
 
 		self.rebuildDataBrushIfNeeded()
-		# self.drawBackground(p, buffer.rect()) # Background
+		# self.drawBackground(p, self.rect()) # Background
 		self.drawBase(p, baseRect) # The base circle
-		self.drawRing(p, baseRect, self.beginAngle, self.getEndAngle()) # The variably-sized data arc
-		innerRect, innerRadius = self.calculateInnerRect(baseRect, outerRadius)
+		self.drawRing(p, baseRect) # The variably-sized data arc
+		if self._innerRectCache is None:
+			self._innerRectCache = self.calculateInnerRect(baseRect, outerRadius)
+		innerRect, innerRadius = self._innerRectCache
 		self.drawInnerBackground(p, innerRect) # The inner circle which makes the thing look like a donut/ring
 		self.drawText(p, innerRect, innerRadius, self.text)
 
 		p.end() # Voila!
 
-		painter = QtGui.QPainter(self)
-		painter.drawImage(0, 0, buffer)
-
 	def drawBackground(self, p, baseRect):
 		if self.customBackground==None:
 			p.fillRect(baseRect, self.palette().window())
@@ -171,18 +223,17 @@ class QRoundBar(QtWidgets.QWidget):
 		else:
 			logging.error("ERROR [QRoundProgressBar.drawBase]: style string {} not known!".format(baseRect))
 
-	def drawRing(self, p, baseRect, beginAngle, endAngle):
+	def drawRing(self, p, baseRect):
 		"""
-		Given angles in degrees beginAngle and endAngle, draws the appropriate circular arc.
+		Draws the circular arc from beginAngle to endAngle, as precomputed by _recalculateAngles().
 		Note while the Qt5 QPainter.drawArc() documentation [http://doc.qt.io/qt-5/qpainter.html#drawArc]
 		claims that it requires an integer number of 1/16 degree segments, 0 degrees is at 3 o'clock,
 		and positive angles are in the CCW direction, the only one of these that bears out experimentally is
 		the default origin being at the eastern compass point.
 		"""
-		startOffset = 90 + int(self.twelveOClockIs)
-		startAngle = startOffset - int(round(beginAngle))
-		spanAngle = int(round(endAngle - beginAngle))
-		# logging.debug("beginAngle: {}  endAngle: {}  startAngle: {}  spanAngle: {}".format(beginAngle, endAngle, startAngle, spanAngle)) # diagnostics
+		startAngle = self._cachedStartAngle
+		spanAngle = self._cachedSpanAngle
+		# logging.debug("beginAngle: {}  endAngle: {}  startAngle: {}  spanAngle: {}".format(self.beginAngle, self._endAngle, startAngle, spanAngle)) # diagnostics
 		if self.barStyle == 'line':
 			p.setPen(QtGui.QPen(self.palette().highlight().color(), self.dataPenWidth))
 			p.setBrush(QtCore.Qt.NoBrush)
@@ -191,7 +242,8 @@ class QRoundBar(QtWidgets.QWidget):
 			return
 
 		# for Pie and Donut styles
-		dataPath = QtGui.QPainterPath()
+		dataPath = self._ringPath
+		dataPath.clear() # Keeps the element storage from the last frame [https://doc.qt.io/qt-6/qpainterpath.html#clear]
 		dataPath.setFillRule(QtCore.Qt.WindingFill) # [http://doc.qt.io/qt-4.8/qt.html#FillRule-enum]
 
 		# pie segment outer
@@ -215,16 +267,19 @@ class QRoundBar(QtWidgets.QWidget):
 
 	def drawInnerBackground(self, p, innerRect):
 		if self.barStyle == 'donut':
+			p.save()
 			p.setBrush(self.palette().alternateBase())
-			cmod = p.compositionMode()
 			p.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
 			p.drawEllipse(innerRect)
-			p.setCompositionMode(cmod)
+			p.restore()
 
 	def drawText(self, p, innerRect, innerRadius, text):
-		f = self.font()
-		f.setPixelSize(innerRadius * 1.2 / max(len(text), 1)) # [http://doc.qt.io/qt-5/qfont.html]
-		p.setFont(f)
+		key = (innerRadius, len(text))
+		if key!=self._fontCacheKey: # Only the size depends on the text, so same-length updates keep the font
+			self._fontCacheKey = key
+			self._fontCache = self.font()
+			self._fontCache.setPixelSize(innerRadius * 1.2 / max(len(text), 1)) # [http://doc.qt.io/qt-5/qfont.html]
+		p.setFont(self._fontCache)
 
 		textRect = innerRect
 		p.setPen(self.palette().text().color())
@@ -237,14 +292,16 @@ class QRoundBar(QtWidgets.QWidget):
 		else:
 			self.rebuildBrush = False
 			if self.gradientData:
-				dataBrush = QtGui.QConicalGradient() # [http://doc.qt.io/qt-5/qbrush.html]
-				dataBrush.setCenter(0.5, 0.5)
-				dataBrush.setCoordinateMode(QtGui.QGradient.StretchToDeviceMode)
-
-				for pos, color in self.gradientData:
-					dataBrush.setColorAt(1.0 - pos, color)
-
-				dataBrush.setAngle(self.beginAngle)
+				if self._gradientBrush is None:
+					self._gradientBrush = QtGui.QConicalGradient() # [http://doc.qt.io/qt-5/qbrush.html]
+					self._gradientBrush.setCenter(0.5, 0.5)
+					self._gradientBrush.setCoordinateMode(QtGui.QGradient.StretchToDeviceMode)
+					for pos, color in self.gradientData:
+						self._gradientBrush.setColorAt(1.0 - pos, color)
+				elif self._gradientBrush.angle()==self.beginAngle:
+					return # The palette already has exactly this gradient
+				self._gradientBrush.setAngle(self.beginAngle)
+				dataBrush = self._gradientBrush
 			else:
 				dataBrush = QtGui.QBrush(QtGui.QColor(self.solidColor))
 				dataBrush.setStyle(QtCore.Qt.SolidPattern) # [http://doc.qt.io/qt-5/qcolor.html#details]
@@ -274,7 +331,10 @@ class QRoundBarAnimated(QRoundBar, QtWidgets.QWidget):
 		override it to trigger the endAngle sweep animation.
 		"""
 		# First, most of the things that QRoundBar.setSweep() does
+		if beginAngle!=self.beginAngle: # setEndAngle() won't repaint if only the beginning moved
+			self._scheduleUpdate()
 		self.beginAngle = beginAngle
+		self._recalculateAngles()
 		if self.solidColor==None:
 			self.rebuildBrush = True
 
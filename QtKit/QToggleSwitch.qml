@@ -0,0 +1,57 @@
+// QtKit.QToggleSwitchQML's scene: the same iOS-style toggle as QToggleSwitch, but with the thumb slide
+// run by an XAnimator on Qt's render thread, so animating never calls back into Python.
+// Colors and labels are set from Python at construction; checked is pushed down from QToggleSwitchQML.
+
+import QtQuick
+
+Rectangle {
+	id: track
+
+	property bool checked: false
+	property color trackOnColor: "steelblue"
+	property color trackOffColor: "gray"
+	property color thumbOnColor: "white"
+	property color thumbOffColor: "lightgray"
+	property color textOnColor: "steelblue"
+	property color textOffColor: "gray"
+	property string trueLabel: "✔"
+	property string falseLabel: "✕"
+	property int thumbInset: 2
+	signal clicked()
+
+	color: checked ? trackOnColor : trackOffColor
+	radius: height/2
+
+	Rectangle {
+		id: thumb
+		x: track.thumbInset
+		y: track.thumbInset
+		width: height
+		height: track.height - 2*track.thumbInset
+		radius: height/2
+		color: track.checked ? track.thumbOnColor : track.thumbOffColor
+
+		Text {
+			anchors.centerIn: parent
+			text: track.checked ? track.trueLabel : track.falseLabel
+			color: track.checked ? track.textOnColor : track.textOffColor
+			font.pixelSize: Math.round(0.65*parent.height)
+		}
+	}
+
+	states: State {
+		name: "on"
+		when: track.checked
+		PropertyChanges { target: thumb; x: track.width - thumb.width - track.thumbInset }
+	}
+
+	transitions: Transition {
+		XAnimator { target: thumb; duration: 120; easing.type: Easing.OutCubic }
+	}
+
+	MouseArea {
+		anchors.fill: parent
+		cursorShape: Qt.PointingHandCursor
+		onClicked: track.clicked()
+	}
+}
@@ -17,9 +17,28 @@ DESIGN NOTES
 
 SOURCES, REFERENCES, AND EXAMPLES REFERRED TO
 - QToggleSwitch was modified from Switch, by Stefan Scherfke [https://stackoverflow.com/a/51825815].
+- QToggleSwitchQML's Animator usage follows [https://doc.qt.io/qt-6/qml-qtquick-animator.html].
 
 
 MODIFICATION HISTORY
+[10/14/2026] The track is rendered once into a cached pixmap rather than redrawn on every repaint.
+			  The thumb is driven by one reusable QVariantAnimation instead of a QPropertyAnimation per click.
+			  Thumb end positions are plain ints updated on resize, rather than lambdas called on every use.
+			  The label font, label placement, and fixed paint geometry are worked out once, not on every repaint.
+			  The thumb offset is kept in whole pixels, and painted with integer QRects.
+			  Opacities are baked into the brushes, and disabled-state brushes prepared with the rest.
+			  Removed the never-used _left_text_offset, which was accidentally a 1-tuple for short labels.
+			  The label's rectangle is allocated once and just moved each repaint.
+			  State-dependent brushes and label are chosen on state changes, not looked up on every repaint.
+			  Repaints make fewer QPainter state changes, and none at all for text when there's no label.
+			  Added QToggleSwitchQML, a QML-drawn variant whose thumb is animated on Qt's render thread.
+			  Thumb moves only repaint the horizontal band it travels in, rather than the whole widget.
+			  Switches sharing a palette share their brushes too, and palette changes now restyle the switch.
+			  Per-state brushes, labels, and thumb positions are (unchecked, checked) tuples instead of bool-keyed dicts.
+			  Palette brushes and colors are fetched at the first repaint rather than at construction.
+			  Short labels on the thumb are drawn from a cached pixmap instead of being re-rendered every frame.
+			  Pens are built once per state (or once, for NoPen), not converted from colors on every repaint.
+			  QToggleSwitchPlusLabelsLayout sets stretch and alignment as it adds widgets; the alignment had been landing in stretch.
 [ 7/14/2022] Renamed QToggleSwitchPlusLabelsLayout's QToggleSwitch instance to .control, to match QtKit.Layouts.
 [ 3/16/2022] Added tiny bundle of laziness QToggleSwitchPlusLabelsLayout.
 [ 6/24/2021] Swapped from PyQt5 to the more flexibly-licensed and officially-supported PySide2 (Qt5).
@@ -30,14 +49,95 @@ MODIFICATION HISTORY
 """
 
 from PySide6 import QtCore, QtGui, QtWidgets
+import os
 import logging
 logging.basicConfig(level=logging.ERROR)
 
 
 
+def _with_alpha(brush, alpha):
+	"""
+	Returns a solid QBrush of brush's color, with its alpha scaled by alpha.
+	"""
+	color = QtGui.QColor(brush.color())
+	color.setAlphaF(color.alphaF() * alpha)
+	return QtGui.QBrush(color)
+
+
+
+_NO_PEN = QtGui.QPen(QtCore.Qt.NoPen) # Shared, so track and thumb fills don't convert a PenStyle to a QPen each time
+_PALETTE_CACHE = {} # Style tuples shared by every QToggleSwitch with the same palette, style, and labels
+
+
+
+def _toggle_style(palette, bigthumb, truelabel, falselabel):
+	"""
+	Builds the brushes, colors, labels, and track opacity for a QToggleSwitch, as the tuple
+	(track_color, thumb_color, text_color, thumb_text, track_opacity, disabled_track_brush, disabled_thumb_brush, disabled_text_color).
+	The per-state entries are (unchecked, checked) pairs, indexed directly by isChecked(), since False==0 and True==1.
+	Every enabled-state brush comes from the Active group, whatever the palette's current group happens to be
+	when this runs (e.g. at a first paint while disabled, or in an inactive window.)
+	"""
+	def active(role):
+		return palette.brush(QtGui.QPalette.Active, role)
+
+	if bigthumb:
+		track_color = (
+			active(QtGui.QPalette.Dark), # Unchecked
+			active(QtGui.QPalette.Highlight), # Checked
+		)
+		thumb_color = (
+			active(QtGui.QPalette.Light), # Unchecked
+			active(QtGui.QPalette.Highlight), # Checked
+		)
+		text_color = (
+			active(QtGui.QPalette.Dark).color(), # Unchecked
+			active(QtGui.QPalette.HighlightedText).color(), # Checked
+		)
+		thumb_text = (
+			'', # Unchecked
+			'', # Checked
+		)
+		track_opacity = 0.5
+	else:
+		thumb_color = (
+			active(QtGui.QPalette.Light), # Unchecked
+			active(QtGui.QPalette.HighlightedText), # Checked
+		)
+		thumb_text = (
+			falselabel, # Unchecked
+			truelabel, # Checked
+		)
+		track_color = (
+			active(QtGui.QPalette.Dark), # Unchecked
+			active(QtGui.QPalette.Highlight), # Checked
+		)
+		if len(truelabel) < 2 and len(falselabel) < 2:
+			text_color = (
+				active(QtGui.QPalette.Dark).color(), # Unchecked
+				active(QtGui.QPalette.Highlight).color(), # Checked
+			)
+		else:
+			text_color = (
+				active(QtGui.QPalette.Highlight).color(), # Unchecked
+				active(QtGui.QPalette.Dark).color(), # Checked
+			)
+		track_opacity = 1
+	# Bake the track opacity into its brushes, so painting never has to touch QPainter.setOpacity()
+	track_color = tuple(_with_alpha(brush, track_opacity) for brush in track_color)
+	# Explicitly from the Disabled group; palette.shadow() etc. would give the palette's current group, usually Active
+	disabled_track_brush = _with_alpha(palette.brush(QtGui.QPalette.Disabled, QtGui.QPalette.Shadow), 0.8*track_opacity)
+	disabled_thumb_brush = palette.brush(QtGui.QPalette.Disabled, QtGui.QPalette.Mid)
+	disabled_text_color = palette.color(QtGui.QPalette.Disabled, QtGui.QPalette.Shadow)
+	return (track_color, thumb_color, text_color, thumb_text, track_opacity, disabled_track_brush, disabled_thumb_brush, disabled_text_color)
+
+
+
 class QToggleSwitch(QtWidgets.QAbstractButton):
 	# Modified from Switch by Stefan Scherfke [https://stackoverflow.com/a/51825815]
 
+	_ready = False # Becomes an instance attribute at the end of __init__(); Qt may send changeEvent()s before then
+
 	def __init__(self, parent=None, truelabel='✔', falselabel='✕'):
 		super().__init__(parent=parent)
 		self.setCheckable(True)
@@ -48,81 +148,86 @@ class QToggleSwitch(QtWidgets.QAbstractButton):
 
 		if len(truelabel) < 2 and len(falselabel) < 2:
 			self._track_text_width = 0
-			self._left_text_offset = {
-				True: 0,
-				False: 0,
-			},
 		else:
 			self._track_text_width = max(len(truelabel), len(falselabel))*self._thumb_radius
-			self._left_text_offset = {
-				True: 2*self._thumb_radius,
-				False: max(self._thumb_radius, self._track_radius) - 2*self._thumb_radius,
-			}
 
 		self._margin = max(0, self._thumb_radius - self._track_radius)
 		self._base_offset = max(self._thumb_radius, self._track_radius)
-		self._end_offset = {
-			True: lambda: self.width() - self._base_offset,
-			False: lambda: self._base_offset,
-		}
-		self._track_offset = {
-			True: lambda: self.width() - self._base_offset,
-			False: lambda: self._base_offset,
-		}
+		self._texttop = self._base_offset - self._thumb_radius # Also the thumb's top
+		self._thumb_d = 2*self._thumb_radius # Also the text height
+		self._damage_rect = QtCore.QRect(0, self._texttop - 1, 0, self._thumb_d + 2) # The band the thumb and labels move in; width set on resize
+		self._recompute_geometry()
 		self._offset = self._base_offset
 
-		palette = self.palette()
-		if self._thumb_radius > self._track_radius:
-			self._track_color = {
-				True: palette.highlight(),
-				False: palette.dark(),
-			}
-			self._thumb_color = {
-				True: palette.highlight(),
-				False: palette.light(),
-			}
-			self._text_color = {
-				True: palette.highlightedText().color(),
-				False: palette.dark().color(),
-			}
-			self._thumb_text = {
-				True: '',
-				False: '',
-			}
-			self._track_opacity = 0.5
+		self._labels = (truelabel, falselabel)
+		self._styled = False # Brushes and colors wait for the first paintEvent(), so hidden switches never build them
+		self._wide_label = self._thumb_radius <= self._track_radius and max(map(len, self._labels)) >= 2 # Labels go in the track rather than on the thumb
+		self._build_font()
+		self._text_rect = QtCore.QRect(0, self._texttop, self._track_text_width if self._wide_label else self._thumb_d, self._thumb_d) # Only its left edge moves
+
+		self._track_cache = None # QPixmap of the track as last drawn; None when it needs redrawing
+		self._label_cache = None # Likewise for the on-thumb label, when there is one
+		self._apply_state()
+		self.toggled.connect(self._apply_state) # Clicks change the check state without going through setChecked()
+		self._ready = True
+
+		# One reusable animation for the thumb, writing straight to self._offset rather than through a Python QProperty
+		self._anim = QtCore.QVariantAnimation(self)
+		self._anim.setDuration(120 + self._track_text_width) # Labels never change, so neither does this
+		self._anim.valueChanged.connect(self._set_offset)
+
+	def _apply_state(self):
+		"""
+		Picks out the brushes, text color, and label for the current checked and enabled state,
+		so paintEvent() needn't ask Qt for either state or look anything up.
+		"""
+		self._track_cache = None
+		self._label_cache = None
+		if not self._styled:
+			return # paintEvent() will be back once it has styled us
+		checked = self.isChecked()
+		if self.isEnabled():
+			self._cur_track_brush = self._track_color[checked]
+			self._cur_thumb_brush = self._thumb_color[checked]
+			self._cur_text_color = self._text_color[checked]
 		else:
-			self._thumb_color = {
-				True: palette.highlightedText(),
-				False: palette.light(),
-			}
-			self._thumb_text = {
-				True: truelabel,
-				False: falselabel,
-			}
-			self._track_color = {
-				True: palette.highlight(),
-				False: palette.dark(),
-			}
-			if len(self._thumb_text[True]) < 2 and len(self._thumb_text[False]) < 2:
-				self._text_color = {
-					True: palette.highlight().color(),
-					False: palette.dark().color(),
-				}
-			else:
-				self._text_color = {
-					True: palette.dark().color(),
-					False: palette.highlight().color(),
-				}
-			self._track_opacity = 1
-
-	@QtCore.Property(int)
-	def offset(self):
-		return self._offset
-
-	@offset.setter
-	def offset(self, value):
-		self._offset = value
-		self.update()
+			self._cur_track_brush = self._disabled_track_brush
+			self._cur_thumb_brush = self._disabled_thumb_brush
+			self._cur_text_color = self._disabled_text_color
+		self._cur_thumb_text = self._thumb_text[checked]
+		self._cur_text_pen = QtGui.QPen(self._cur_text_color) # Built here, so setPen() needn't make one from the QColor per repaint
+
+	def _build_style(self):
+		"""
+		Fetches this switch's brushes, colors, and labels from _PALETTE_CACHE, building them only
+		the first time a given palette, style, and pair of labels turns up.
+		"""
+		key = self._style_key = (self.palette().cacheKey(), self._thumb_radius > self._track_radius) + self._labels
+		style = _PALETTE_CACHE.get(key)
+		if style is None:
+			if len(_PALETTE_CACHE) >= 64: # Stale palettes' entries would otherwise pile up; switches keep their own references, so clearing is safe
+				_PALETTE_CACHE.clear()
+			style = _PALETTE_CACHE[key] = _toggle_style(self.palette(), *key[1:])
+		(self._track_color, self._thumb_color, self._text_color, self._thumb_text, self._track_opacity,
+			self._disabled_track_brush, self._disabled_thumb_brush, self._disabled_text_color) = style
+		self._styled = True
+
+	def _build_font(self):
+		self._font = QtGui.QFont(self.font())
+		self._font.setPixelSize(int(1.3 * self._thumb_radius))
+
+	def _recompute_geometry(self):
+		"""
+		Thumb-center offsets for the checked and unchecked positions, and the track size; these only change on resize.
+		"""
+		self._thumb_end = (self._base_offset, self.width() - self._base_offset) # (unchecked, checked)
+		self._track_w = self.width() - 2*self._margin
+		self._track_h = self.height() - 2*self._margin
+		self._damage_rect.setWidth(self.width())
+
+	def _set_offset(self, value):
+		self._offset = int(value) # Whole pixels, so paintEvent() can use QPainter's integer overloads
+		self.update(self._damage_rect) # Qt already repaints everything on check, enable, palette, and resize changes
 
 	def sizeHint(self):  # pylint: disable=invalid-name
 		return QtCore.QSize(
@@ -132,76 +237,112 @@ class QToggleSwitch(QtWidgets.QAbstractButton):
 
 	def setChecked(self, checked):
 		super().setChecked(checked)
-		self.offset = self._end_offset[checked]()
+		self._set_offset(self._thumb_end[checked])
 
 	def resizeEvent(self, event):
 		super().resizeEvent(event)
-		self.offset = self._end_offset[self.isChecked()]()
-
-	def paintEvent(self, event):  # pylint: disable=invalid-name, unused-argument
-		p = QtGui.QPainter(self)
-		p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-		p.setPen(QtCore.Qt.NoPen)
-		track_opacity = self._track_opacity
-		thumb_opacity = 1.0
-		text_opacity = 1.0
-		if self.isEnabled():
-			track_brush = self._track_color[self.isChecked()]
-			thumb_brush = self._thumb_color[self.isChecked()]
-			text_color = self._text_color[self.isChecked()]
-		else:
-			track_opacity *= 0.8
-			track_brush = self.palette().shadow()
-			thumb_brush = self.palette().mid()
-			text_color = self.palette().shadow().color()
-
-		# Draw the track
-		p.setBrush(track_brush)
-		p.setOpacity(track_opacity)
-		p.drawRoundedRect(
+		self._recompute_geometry()
+		self._apply_state()
+		self._set_offset(self._thumb_end[self.isChecked()])
+
+	def changeEvent(self, event):
+		if not self._ready:
+			pass
+		elif event.type()==QtCore.QEvent.EnabledChange:
+			self._apply_state()
+		elif event.type()==QtCore.QEvent.PaletteChange and self._styled:
+			self._styled = False # Restyled at the next paintEvent(), which Qt is already scheduling
+			self._track_cache = None
+			self._label_cache = None
+		elif event.type()==QtCore.QEvent.FontChange:
+			self._build_font()
+			self._label_cache = None
+		super().changeEvent(event)
+
+	def _render_track(self, track_brush):
+		"""
+		The track only changes on resize, enable, or check, so it's drawn once into a pixmap
+		and just blitted by every paintEvent() in between, e.g. during the thumb animation.
+		"""
+		dpr = self.devicePixelRatioF()
+		self._track_cache = QtGui.QPixmap(self.size() * dpr)
+		self._track_cache.setDevicePixelRatio(dpr)
+		self._track_cache.fill(QtCore.Qt.transparent)
+		tp = QtGui.QPainter(self._track_cache)
+		tp.setRenderHint(QtGui.QPainter.Antialiasing, True)
+		tp.setPen(_NO_PEN)
+		tp.setBrush(track_brush)
+		tp.drawRoundedRect(
 			self._margin, # x
 			self._margin, # y
-			self.width() - 2*self._margin, # w
-			self.height() - 2*self._margin, # h
+			self._track_w, # w
+			self._track_h, # h
 			self._track_radius, # xRadius
 			self._track_radius, # yRadius
 		)
+		tp.end()
+
+	def _render_label(self):
+		"""
+		A label riding on the thumb only changes with the state or font, so its glyph is rasterized once
+		into a thumb-sized pixmap, rather than shaped and drawn by drawText() on every animation frame.
+		"""
+		dpr = self.devicePixelRatioF()
+		self._label_cache = QtGui.QPixmap(QtCore.QSize(self._thumb_d, self._thumb_d) * dpr)
+		self._label_cache.setDevicePixelRatio(dpr)
+		self._label_cache.fill(QtCore.Qt.transparent)
+		lp = QtGui.QPainter(self._label_cache)
+		lp.setRenderHint(QtGui.QPainter.Antialiasing, True)
+		lp.setPen(self._cur_text_pen)
+		lp.setFont(self._font)
+		lp.drawText(QtCore.QRect(0, 0, self._thumb_d, self._thumb_d), QtCore.Qt.AlignCenter, self._cur_thumb_text)
+		lp.end()
+
+	def paintEvent(self, event):  # pylint: disable=invalid-name, unused-argument
+		# A fresh QPainter starts at the default SourceOver composition and opacity 1.0, which is all
+		# we need, so the only state changes are the antialiasing hint, pens, brush, and font
+		if not self._styled:
+			self._build_style()
+			self._apply_state()
+		p = QtGui.QPainter(self)
+
+		# Draw the track; during thumb moves Qt clips this to _damage_rect, the band the thumb erases and redraws in
+		if self._track_cache is None:
+			self._render_track(self._cur_track_brush)
+		p.drawPixmap(0, 0, self._track_cache)
 		# Draw the thumb button in its initial-state position
-		p.setBrush(thumb_brush)
-		p.setOpacity(thumb_opacity)
-		p.drawEllipse(
-			self.offset - self._thumb_radius, # left
-			self._base_offset - self._thumb_radius, # top
-			2*self._thumb_radius, # width
-			2*self._thumb_radius, # height
-		)
-		p.setPen(text_color)
-		p.setOpacity(text_opacity)
-		font = p.font()
-		font.setPixelSize(1.3 * self._thumb_radius)
-		p.setFont(font)
-		texttop = self._base_offset - self._thumb_radius
-		textheight = 2*self._thumb_radius
-		if len(self._thumb_text[True]) < 2 and len(self._thumb_text[False]) < 2:
-			# Text goes on top of the thumb
-			textleft = self.offset - self._thumb_radius
-			textwidth = 2*self._thumb_radius
+		p.setRenderHint(QtGui.QPainter.Antialiasing, True) # Not needed for the pixmap blit
+		p.setPen(_NO_PEN)
+		p.setBrush(self._cur_thumb_brush)
+		p.drawEllipse(QtCore.QRect(
+			self._offset - self._thumb_radius, # left
+			self._texttop, # top
+			self._thumb_d, # width
+			self._thumb_d, # height
+		))
+		if not self._cur_thumb_text:
+			return # Nothing to label, so skip the text pen, font, and layout altogether
+		if not self._wide_label:
+			# Text goes on top of the thumb, as a prerendered glyph
+			if self._label_cache is None:
+				self._render_label()
+			p.drawPixmap(self._offset - self._thumb_radius, self._texttop, self._label_cache)
 		else:
 			# Text goes into the track, avoiding the thumb
-			# textleft = self.offset - 2*self._thumb_radius
-			textleft = self._track_text_width - 0.5*self.offset
-			textwidth = self._track_text_width
-		p.drawText(QtCore.QRectF(textleft, texttop, textwidth, textheight), QtCore.Qt.AlignCenter, self._thumb_text[self.isChecked()])
+			# self._text_rect.moveLeft(self._offset - 2*self._thumb_radius)
+			p.setPen(self._cur_text_pen)
+			p.setFont(self._font)
+			self._text_rect.moveLeft(self._track_text_width - self._offset//2)
+			p.drawText(self._text_rect, QtCore.Qt.AlignCenter, self._cur_thumb_text)
 
 	def mouseReleaseEvent(self, event):
 		super().mouseReleaseEvent(event)
-		# logging.debug("_track_text_width: {!s}, offset: {!s}, text left offset: {!s}".format(self._track_text_width, self.offset, self._track_text_width - 0.5*self.offset)) # diagnostics
+		# logging.debug("_track_text_width: {!s}, offset: {!s}, text left offset: {!s}".format(self._track_text_width, self._offset, self._track_text_width - 0.5*self._offset)) # diagnostics
 		if event.button() == QtCore.Qt.LeftButton:
-			anim = QtCore.QPropertyAnimation(self, b'offset', self)
-			anim.setDuration(120 + self._track_text_width)
-			anim.setStartValue(self.offset)
-			anim.setEndValue(self._end_offset[self.isChecked()]())
-			anim.start()
+			self._anim.stop()
+			self._anim.setStartValue(self._offset)
+			self._anim.setEndValue(self._thumb_end[self.isChecked()])
+			self._anim.start()
 
 	def enterEvent(self, event):
 		self.setCursor(QtCore.Qt.PointingHandCursor)
@@ -209,6 +350,69 @@ class QToggleSwitch(QtWidgets.QAbstractButton):
 
 
 
+class QToggleSwitchQML(QtWidgets.QWidget):
+	# A drop-in alternative to QToggleSwitch, drawn by QtKit/QToggleSwitch.qml in a QQuickWidget.
+	# The thumb slide is a QML XAnimator, which runs on Qt's render thread without any Python per frame.
+	# QtQuickWidgets is only imported when one of these is made, so QToggleSwitch users don't pay for it.
+
+	toggled = QtCore.Signal(bool)
+	QML_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'QToggleSwitch.qml')
+
+	def __init__(self, parent=None, truelabel='✔', falselabel='✕'):
+		super().__init__(parent=parent)
+		from PySide6 import QtQuickWidgets
+		self.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+		self._checked = False
+
+		self._view = QtQuickWidgets.QQuickWidget(self)
+		self._view.setResizeMode(QtQuickWidgets.QQuickWidget.SizeRootObjectToView)
+		self._view.setAttribute(QtCore.Qt.WA_AlwaysStackOnTop) # Otherwise the rounded corners aren't transparent
+		self._view.setClearColor(QtCore.Qt.transparent)
+		self._view.setSource(QtCore.QUrl.fromLocalFile(self.QML_FILE))
+		self._root = self._view.rootObject()
+		if self._root is None:
+			raise RuntimeError("QToggleSwitchQML couldn't load {!s}: {!s}".format(self.QML_FILE, [str(err.toString()) for err in self._view.errors()]))
+		layout = QtWidgets.QVBoxLayout(self)
+		layout.setContentsMargins(0, 0, 0, 0)
+		layout.addWidget(self._view)
+
+		# Same colors (and labels) as QToggleSwitch's small-thumb style, set once from our palette
+		palette = self.palette()
+		for name, value in (
+			('trackOnColor', palette.highlight().color()),
+			('trackOffColor', palette.dark().color()),
+			('thumbOnColor', palette.highlightedText().color()),
+			('thumbOffColor', palette.light().color()),
+			('textOnColor', palette.highlight().color()),
+			('textOffColor', palette.dark().color()),
+			('trueLabel', truelabel),
+			('falseLabel', falselabel),
+		):
+			self._root.setProperty(name, value)
+		self._root.clicked.connect(self._onClicked)
+
+	def isChecked(self):
+		return self._checked
+
+	def setChecked(self, checked):
+		checked = bool(checked)
+		if checked == self._checked:
+			return
+		self._checked = checked
+		self._root.setProperty('checked', checked) # QML's state change and transition take it from here
+		self.toggled.emit(checked)
+
+	checked = QtCore.Property(bool, isChecked, setChecked, notify=toggled)
+
+	@QtCore.Slot()
+	def _onClicked(self):
+		self.setChecked(not self._checked)
+
+	def sizeHint(self):  # pylint: disable=invalid-name
+		return QtCore.QSize(40, 20) # Matches QToggleSwitch's with its default radii and short labels
+
+
+
 
 
 
@@ -216,22 +420,19 @@ class QToggleSwitch(QtWidgets.QAbstractButton):
 class QToggleSwitchPlusLabelsLayout(QtWidgets.QHBoxLayout):
 	# A mini helper that bundles a label and a QToggleSwitch in sheer OO laziness
 	
-	def __init__(self, rightlabel='', leftlabel='', defaultchecked=False, *args, **kwargs):
+	def __init__(self, rightlabel='', leftlabel='', defaultchecked=False, *args, switchclass=QToggleSwitch, **kwargs):
 		"""
 		Prepacks the QHBoxLayout with two labels and a QToggleSwitch... and that's pretty much it.
+		Pass switchclass=QToggleSwitchQML for the QML-drawn switch instead.
 		"""
 		super(QToggleSwitchPlusLabelsLayout, self).__init__(*args, **kwargs)
 		self.leftlabel = QtWidgets.QLabel(leftlabel)
-		if leftlabel !='':
-			self.addWidget(self.leftlabel, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-		self.control = QToggleSwitch()
+		self.control = switchclass()
 		self.control.setChecked(defaultchecked) # Helps the user locate the mask if switched on before adjusting
-		self.addWidget(self.control, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
 		self.rightlabel = QtWidgets.QLabel(rightlabel)
-		if rightlabel !='':
-			self.addWidget(self.rightlabel, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-		
-		# Adjust spacings
-		for childnumber in range(self.count()):
-			self.setStretch(childnumber, 1)
+
+		# Add everything with its stretch and alignment in one go, rather than re-stretching (and re-invalidating) afterwards
+		for widget, wanted in ((self.leftlabel, leftlabel !=''), (self.control, True), (self.rightlabel, rightlabel !='')):
+			if wanted:
+				self.addWidget(widget, 1, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
 			
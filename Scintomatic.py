@@ -22,9 +22,49 @@ SOURCES, REFERENCES, AND EXAMPLES REFERRED TO
   [https://256stuff.com/gray/docs/latin.html]
 - pyqtgraph offers better Qt integration and much more speed than our old standby matplotlib:
   [https://www.pythonguis.com/tutorials/pyside-plotting-pyqtgraph/]
+  Its OpenGL curve drawing needs PyOpenGL: [https://pyqtgraph.readthedocs.io/en/latest/api_reference/config_options.html]
 
 
 MODIFICATION HISTORY
+[10/14/2026] ScintomaticError is now a labeled InstrumentComm exception.
+             Plot data is kept in preallocated, doubling numpy buffers rather than ever-growing lists.
+             Plot redraws are coalesced by a 50 ms timer rather than done for every serial line.
+             Time plots can be drawn with OpenGL, if PyOpenGL is installed and SCINTOMATIC_OPENGL=1 is set.
+             Spectra are filled in only once complete, sparing every live redraw the polygon fill.
+             interpreter() drains every queued line per wakeup, and the serial thread no longer naps between reads.
+             The spectrum bitsum is counted with one numpy reduction per line instead of a bin() per byte.
+             Line regexes use google-re2 when installed, and stop at their first match rather than findall()ing.
+             Fixed the sample number never being displayed, thanks to a sampleNumber/samplenumber typo.
+             Saved data is written by a single np.savetxt() rather than a Python loop per point.
+             PlotPanels share one set of pens, brushes, fonts, and palette colors instead of each building its own.
+             Redraws tell pyqtgraph to skip its finite-value check, as our buffers only ever hold counts.
+             The serial thread reads whatever's waiting in one go and splits lines itself, not read_until()'s byte at a time.
+             Spectrum channel numbers are filled in once per spectrum; only counts are written as they arrive.
+             Live plots track their own bounds instead of having pyqtgraph re-scan all the data for auto-ranging.
+             Where the port has a file descriptor, the serial thread waits on it with selectors instead of in read().
+             PlotPanel label styling is applied with updates suspended, for one repaint rather than one per label.
+             Long plots are peak-downsampled to the view's width, and clipped to what's visible.
+             Autosaves take the time once, for both the filename and the export header.
+             SerialHelper is now a QRunnable run by the global QThreadPool, rather than a QObject in its own QThread.
+             Fixed closing the window skipping its autosaves, which were attempted on the classes instead of the panels.
+             Saved files are written through a 1 MB buffer.
+             Arial 10 is now the application font, so the small labels no longer each need setting to it.
+             Line regexes are raw bytes literals, shedding the invalid-escape warnings their plain literals drew.
+             Spectrum chunks are decoded by numpy array operations instead of a Python loop per chunk and byte.
+             The bitsum comes from int.bit_count() over each line as one big integer, where Python has it (3.10+).
+             Spectrum buffers start zeroed, so a channel the counter hasn't reported yet reads as an honest zero.
+             Progress rings and labels are updated along with their plots' redraws, now at most ~30 times a second, not per line.
+             Binary spectrum lines are gathered up and decoded once per batch of lines, in place of patching chunks split across reads.
+             The serial label skips binary spectrum lines, and only escapes as much of a line as it can show.
+             Dropped byte_reconstructor(), unused since decode_spectrum() took over decoding spectra.
+             Binary spectrum lines are recognized first, before testing for any of the text lines' prefixes.
+             The time axis label changes once, when a readout turns out not to be in seconds, rather than on every point after.
+             A time readout's protocol name and sample number are only re-parsed when the line giving them changes.
+             Binary spectrum lines are taken as they come, no longer copied by strip(), which could also eat a byte of value 10.
+             Per-line debug logging defers its formatting to logging, so it costs next to nothing while debug output is off.
+             Before Python 3.10, the bitsum comes from a 256-entry popcount table applied with bytes.translate().
+             Each time count line's time and counts are converted to ints once, not at every use.
+             The bitsum is counted over each batch of binary bytes as it's decoded, rather than line by line as they arrive.
 [ 2/16/2023] Finally added detection and GUI selection of serial ports.
 [ 6/13/2022] Pruned a little vestigial code.
 [ 4/17/2022] Simplified QRoundBar invocations and tweaked UI layout. 
@@ -54,10 +94,14 @@ import pyqtgraph
 import sys
 import os
 import platform
-import time
+import importlib.util
 from datetime import datetime
-import re
+try:
+    import re2 as re # google-re2's linear-time matching, if installed; a drop-in for the patterns we use [https://github.com/google/re2/tree/main/python]
+except ImportError:
+    import re
 import queue
+import selectors
 
 import InstrumentComm
 import serial.tools.list_ports # For port detection [https://stackoverflow.com/a/52809180]
@@ -66,19 +110,141 @@ import scintillationcounters
 import logging
 logging.basicConfig(filename='Scintomatic.log', encoding='utf-8', level=logging.ERROR)
 
+# Optionally (set SCINTOMATIC_OPENGL=1, as PyOpenGL importing is no guarantee of a working GL context),
+# have pyqtgraph draw long lines on the GPU instead of building a QPainterPath per redraw
+PLOTS_USE_OPENGL = False
+if os.environ.get('SCINTOMATIC_OPENGL')=='1':
+    if importlib.util.find_spec('OpenGL') is not None: # pyqtgraph imports PyOpenGL itself; we only need to know it's there
+        pyqtgraph.setConfigOption('enableExperimental', True) # Required for PlotCurveItem's OpenGL path
+        pyqtgraph.setConfigOption('antialias', False)
+        PLOTS_USE_OPENGL = True
+    else:
+        logging.warning("SCINTOMATIC_OPENGL is set, but PyOpenGL isn't installed; drawing plots without it.")
+
+
+
+# Lookup tables for decode_spectrum()
+POW250 = 250 ** np.arange(8, dtype=np.int64) # Base-250 place values; eight digits is far beyond any count we'll see
+SPECTRUM_BYTE_VALUES = np.arange(256, dtype=np.int64) # What each byte stands for as a digit or zero-run length
+SPECTRUM_BYTE_VALUES[252] = 0 # End of stream
+SPECTRUM_BYTE_VALUES[253] = 13
+SPECTRUM_BYTE_VALUES[254] = 35
+
+
+def decode_spectrum(buf):
+    """
+    Decodes bytes of a Commfil v.2 binary spectrum block (see the notes in Scintomatic._parse_line())
+    into an int64 array of channel counts, with every per-byte step done as a numpy array operation.
+    buf should hold whole chunks, i.e. the 0xff separators but not the other bytes of any chunk left
+    unfinished. Each chunk is decoded just as bytechunk_interpreter() used to, one at a time:
+    a chunk starting with 251 leads with (251, run length) pairs, each a run of 0s, and otherwise
+    everything (up to any 252) is one base-250, LSB-first value. A trailing 251 without its
+    run length counts as no 0s, rather than raising IndexError as the loop did.
+    """
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    n = len(arr)
+    if n==0:
+        return np.zeros(0, dtype=np.int64)
+    idx = np.arange(n)
+    issep = arr==255
+    chunkid = np.cumsum(issep) # Each byte's chunk number (a separator gets the number of the chunk after it)
+    starts = np.concatenate(([0], np.flatnonzero(issep) + 1)) # Index of each chunk's first byte (n, if that chunk's empty and last)
+    inchunk = ~issep
+    offset = idx - starts[chunkid] # Position within its chunk
+    values = SPECTRUM_BYTE_VALUES[arr]
+
+    def chunkcumsum(mask):
+        # Running count of mask within each chunk, starting afresh at every chunk's first byte
+        c = np.cumsum(mask)
+        return c - np.concatenate(([0], c))[starts][chunkid]
+
+    # Zero-run prefixes: from the start of a chunk beginning with 251, up to the first even offset not holding 251
+    runchunk = np.zeros(len(starts), dtype=bool)
+    nonempty = starts < n
+    runchunk[nonempty] = arr[starts[nonempty]]==251
+    even = inchunk & (offset % 2==0)
+    inprefix = inchunk & runchunk[chunkid] & (chunkcumsum(even & (arr!=251))==0)
+    markerpos = np.flatnonzero(inprefix & even) # The 251s; each run length follows right after
+    countpos = markerpos + 1
+    hascount = countpos < n
+    hascount[hascount] = ~issep[countpos[hascount]]
+    runlengths = np.where(hascount, values[np.minimum(countpos, n-1)], 0)
+
+    # Values: whatever follows the prefix (or the whole chunk, without one), as digits until any 252
+    invalue = inchunk & ~inprefix
+    digits = invalue & (chunkcumsum(invalue & (arr==252))==0)
+    valuestart = np.full(len(starts), n)
+    np.minimum.at(valuestart, chunkid[invalue], idx[invalue])
+    exponent = idx - valuestart[chunkid]
+    digits &= exponent < len(POW250)
+    chunkvalues = np.zeros(len(starts), dtype=np.int64)
+    np.add.at(chunkvalues, chunkid[digits], values[digits] * POW250[exponent[digits]])
+    hasvalue = valuestart < n
+    hasvalue[hasvalue] &= ~(runchunk[hasvalue] & (arr[valuestart[hasvalue]]==252)) # 252 right after a zero run ends the chunk outright
+
+    # Lay out the zero runs and values in the order they appeared
+    positions = np.concatenate((markerpos, valuestart[hasvalue]))
+    order = np.argsort(positions, kind='stable')
+    emitvalues = np.concatenate((np.zeros(len(markerpos), dtype=np.int64), chunkvalues[hasvalue]))[order]
+    emitcounts = np.concatenate((runlengths, np.ones(np.count_nonzero(hasvalue), dtype=np.int64)))[order]
+    return np.repeat(emitvalues, emitcounts)
+
+
+if hasattr(int, 'bit_count'):
+    def popcount(data):
+        """
+        Number of set bits in bytes-like data: one C-level popcount over it all as a single integer
+        (Python 3.10+) [https://docs.python.org/3/library/stdtypes.html#int.bit_count]
+        """
+        return int.from_bytes(data, 'little').bit_count()
+else:
+    POPCOUNT_TABLE = bytes(bin(byte).count('1') for byte in range(256)) # Each byte value's number of set bits
+
+    def popcount(data):
+        """
+        Number of set bits in bytes-like data, for Pythons before int.bit_count(): translate() swaps each byte
+        for its count in one C-level pass, leaving only a sum of small ints.
+        """
+        return sum(data.translate(POPCOUNT_TABLE))
+
 
 class PlotPanel(QtWidgets.QWidget):
     # QWidget GUI and some methods for displaying data, customizable downstream
 
+    _stylesBuilt = False # The first PlotPanel builds the class-wide styles below; see _buildSharedStyles()
+    openGLCapable = True # Whether this panel's plot may be drawn with OpenGL, when PLOTS_USE_OPENGL
+
+
+    @classmethod
+    def _buildSharedStyles(cls, palette):
+        """
+        Creates the pens, brushes, fonts, and colors every PlotPanel uses, once per run rather than once per
+        panel (and label.) It waits for the first instance, as QFonts want a QApplication to exist first.
+        """
+        if cls._stylesBuilt:
+            return
+        cls.bgcolor = palette.color(QtGui.QPalette.Window) # Set plot background color to same as default window color
+        cls.textcolor = palette.color(QtGui.QPalette.WindowText) # [https://doc.qt.io/qtforpython-5/PySide2/QtGui/QPalette.html#PySide2.QtGui.PySide2.QtGui.QPalette.ColorRole]
+        cls.linepen = pyqtgraph.mkPen(color=(44, 160, 44), width=3) # For just lines, in matplotlib's default green color
+        cls.fillbrush = pyqtgraph.mkBrush(color=(44, 160, 44, 100)) # For filling in the area below lines; tuple is (r, g, b, a), all [0-255]
+        cls.axislabelstyles = {'color':cls.textcolor, 'font-size':'14px'}
+        cls.largefont = QtGui.QFont('Arial', 16)
+        cls._stylesBuilt = True
+
+
     def __init__(self, parent):
         """
         Initializes a PlotPanel, a base class which can be customized for our various plots.
         """
         super(PlotPanel, self).__init__(parent=parent)
+        PlotPanel._buildSharedStyles(self.palette())
 
         # First, some declarations and defaults
-        self.xdata = []
-        self.ydata = []
+        self.npoints = 0 # How much of the data buffers is filled; see reinit()
+        self.ymax = 0 # Running maximum of ydata, kept up by whatever adds data, for redraw()'s view ranging
+        self.fixedXRange = None # Or (min, max), for plots whose x extent is known in advance
+        self._xbuf = np.empty(0, dtype=np.float64)
+        self._ybuf = np.empty(0, dtype=np.float64)
         if os.path.isdir(os.path.join(os.getcwd(), 'Autosave')):
             self.autosaveDir = os.path.join(os.getcwd(), 'Autosave')
         else:
@@ -89,14 +255,13 @@ class PlotPanel(QtWidgets.QWidget):
 
         # On the left, the main line plot
         self.lineplot = pyqtgraph.PlotWidget()
+        self.lineplot.useOpenGL(PLOTS_USE_OPENGL and self.openGLCapable)
         self.lineplot.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self.lineplot.updateGeometry()
-        bgcolor = self.palette().color(QtGui.QPalette.Window) # Set plot background color to same as default window color
-        self.lineplot.setBackground(bgcolor)
-        textcolor = self.palette().color(QtGui.QPalette.WindowText) # [https://doc.qt.io/qtforpython-5/PySide2/QtGui/QPalette.html#PySide2.QtGui.PySide2.QtGui.QPalette.ColorRole]
-        self.linepen = pyqtgraph.mkPen(color=(44, 160, 44), width=3) # For just lines, in matplotlib's default green color
-        self.fillbrush = pyqtgraph.mkBrush(color=(44, 160, 44, 100)) # For filling in the area below lines; tuple is (r, g, b, a), all [0-255]
-        self.axislabelstyles = {'color':textcolor, 'font-size':'14px'}
+        self.lineplot.setBackground(self.bgcolor)
+        self.lineplot.setDownsampling(auto=True, mode='peak') # At most a min/max pair per pixel column, however long the run [https://pyqtgraph.readthedocs.io/en/latest/api_reference/graphicsItems/plotitem.html]
+        self.lineplot.setClipToView(True) # And nothing outside the view at all
+        self.lineplot.getViewBox().sigRangeChangedManually.connect(self._stopFollowing) # Once the user pans or zooms, leave the view to them
 
         # In a small right sidebar:
         self.rightbarLayout = QtWidgets.QVBoxLayout()
@@ -150,7 +315,6 @@ class PlotPanel(QtWidgets.QWidget):
         self.autosaveSwitch.setChecked(True)
         autosaveLayout.addWidget(self.autosaveSwitch, QtCore.Qt.AlignLeft | QtCore.Qt.AlignBottom)
         self.autosaveLabel = QtWidgets.QLabel('Autosave', self)
-        self.autosaveLabel.setFont(QtGui.QFont('Arial', 10))
         autosaveLayout.addWidget(self.autosaveLabel, QtCore.Qt.AlignRight | QtCore.Qt.AlignBottom)
         self.autosaveLabel.mousePressEvent = lambda mouseevent: self.setAutosaveDir() # The lambda wrapper serves to discard the mouse click event
         self.autosaveLabel.setToolTip("Automatically save this data to a time-stamped .txt file when the next recording begins, or upon Scintomatic exit. Click to set destination directory. Note it is never automatically purged!")
@@ -160,27 +324,111 @@ class PlotPanel(QtWidgets.QWidget):
         self.saveButton.clicked.connect(PlotPanel.saveFile(self.saveData))
         self.rightbarLayout.addWidget(self.saveButton, QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
 
-        # Cosmetic options for the labels above
+        # Cosmetic options for the labels above, with updates held off until all are done [https://doc.qt.io/qt-6/qwidget.html#updatesEnabled-prop]
+        self.setUpdatesEnabled(False)
         for fixedlabel in [label_protocolname, label_date, label_sample, label_starttime]:
-            fixedlabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignBottom)
-            fixedlabel.setFont(QtGui.QFont('Arial', 10))
+            fixedlabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignBottom) # Their font is the application's
         for varlabel in [self.protocolnameLabel, self.dateLabel, self.samplenumberLabel, self.starttimeLabel]:
-            varlabel.setFont(QtGui.QFont('Arial', 16))
+            varlabel.setFont(self.largefont)
             varlabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        self.setUpdatesEnabled(True)
 
         # Finally, the panel layout
         self.mainLayout.addWidget(self.lineplot, stretch=9)
         self.mainLayout.addLayout(self.rightbarLayout, stretch=1)
 
 
+    @property
+    def xdata(self):
+        """
+        The x values received so far, as a view into the preallocated buffer (so no copying.)
+        """
+        return self._xbuf[:self.npoints]
+
+    @property
+    def ydata(self):
+        """
+        The y values received so far, as a view into the preallocated buffer (so no copying.)
+        """
+        return self._ybuf[:self.npoints]
+
+
+    def _reserve(self, needed):
+        """
+        Doubles the data buffers' capacity until they can hold needed points. Amortized, that's O(1) per point,
+        and pyqtgraph gets float64 ndarrays it needn't convert, instead of lists it must.
+        """
+        capacity = len(self._xbuf)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._xbuf = np.resize(self._xbuf, capacity)
+            self._ybuf = np.resize(self._ybuf, capacity)
+
+
+    def append(self, x, y):
+        """
+        Adds a single point to the data; call redraw() to show it.
+        """
+        self._reserve(self.npoints + 1)
+        self._xbuf[self.npoints] = x
+        self._ybuf[self.npoints] = y
+        self.npoints += 1
+        if y > self.ymax:
+            self.ymax = y
+
+
+    def redraw(self):
+        """
+        Hands the plot line the current data views. They only ever hold whole-number counts and times,
+        so pyqtgraph can skip scanning them for NaNs and infs before building its path. (It already copies
+        float64 arrays into a QPolygonF-backed buffer itself [https://pyqtgraph.readthedocs.io/en/latest/api_reference/graphicsItems/plotdataitem.html].)
+        """
+        self.plotline.setData(self.xdata, self.ydata, skipFiniteCheck=True)
+        # Auto-ranging is off during acquisition, as it would scan all the data on every redraw; we know the bounds already
+        if self.followingData and self.npoints:
+            bounds = (self.fixedXRange or (self._xbuf[0], self._xbuf[self.npoints-1]), (0, self.ymax))
+            if bounds != self._viewBounds:
+                self.lineplot.setRange(xRange=bounds[0], yRange=bounds[1])
+                self._viewBounds = bounds
+
+
+    def showProgress(self):
+        """
+        Updates the progress ring and label to reflect the data so far; called alongside redraw().
+        Does nothing here, but can be overridden by heirs.
+        """
+        pass
+
+
+    @QtCore.Slot()
+    def _stopFollowing(self):
+        self.followingData = False
+
+
+    def finishRange(self):
+        """
+        Hands view ranging back to pyqtgraph, once an acquisition is complete.
+        """
+        self.followingData = False
+        self.lineplot.enableAutoRange()
+
+
     def reinit(self):
         """
         Blank all class-held data and re-initialize the plot.
         """
-        self.xdata = []
-        self.ydata = []
+        self.npoints = 0
+        self.ymax = 0
+        self._xbuf = np.empty(1024, dtype=np.float64) # A full spectrum, or 17 minutes of time counts, before the first doubling
+        self._ybuf = np.empty(1024, dtype=np.float64)
         self.lineplot.clear()
         self.plotline = self.lineplot.plot(self.xdata, self.ydata, pen=self.linepen) # Ahahahaaaaa
+        self.lineplot.disableAutoRange() # redraw() sets the view instead, until finishRange()
+        self.followingData = True
+        self._viewBounds = None
+        if self.fixedXRange:
+            self.lineplot.setXRange(*self.fixedXRange)
         self.progressRing.setSweep(0, 0)
         self.progressRing.setText(' ')
 
@@ -261,15 +509,16 @@ class TimePanel(PlotPanel):
         self.lineplot.showGrid(x=True, y=True)
 
 
-    def saveData(self, destfilename):
+    def saveData(self, destfilename, exported=None):
         """
         Generates a tab-separated text file containing the received data
-        represented in the plot.
+        represented in the plot. exported is the datetime to record as the time of export, if not now.
         """
-        textFile = open(f"{destfilename}.txt", 'w') # Use 'a' if you want to append instead
+        exported = exported or datetime.now()
+        textFile = open(f"{destfilename}.txt", 'w', buffering=1<<20) # Use 'a' if you want to append instead; 1 MB buffer so even long runs are a few write()s
         textFile.write("# Scintomatic \n")
         textFile.write("# Time count record \n")
-        textFile.write(f"# Exported: {datetime.now().strftime('%H:%M:%S, %A, %b %d, %Y')} \n")
+        textFile.write(f"# Exported: {exported.strftime('%H:%M:%S, %A, %b %d, %Y')} \n")
         textFile.write(f"# Measurement type: {self.protocolnameLabel.text()} \n")
         textFile.write(f"# Measurement date (Scintomatic time): {self.dateLabel.text()} \n")
         textFile.write(f"# Measurement sample number: {self.samplenumberLabel.text()} \n")
@@ -279,8 +528,7 @@ class TimePanel(PlotPanel):
         textFile.write("# \n")
         textFile.write("# \n")
         textFile.write(f"# Time (s)\tCounts (per minute)\n")
-        for seconds, cpm in zip(self.xdata, self.ydata):
-            textFile.write(f"{seconds}\t{cpm}\n")
+        np.savetxt(textFile, np.column_stack((self.xdata, self.ydata)), fmt='%.15g', delimiter='\t') # Buffers are float64, but the values are whole numbers
         textFile.close()
 
 
@@ -289,8 +537,9 @@ class TimePanel(PlotPanel):
         Invokes saveData() to save the current data. Intended to be used when a time data or spectra
         collection has concluded. Yes, these files will tend to pile up...
         """
-        if self.autosaveSwitch.isChecked() and len(self.ydata) > 0:
-            self.saveData(os.path.join(self.autosaveDir, f"{self.protocolnameLabel.text().strip(' ')}-{self.samplenumberLabel.text()} time - {datetime.now().strftime('%H-%M-%S, %Y%m%d')} Scintomatic AUTOSAVE"))
+        if self.autosaveSwitch.isChecked() and self.npoints > 0:
+            now = datetime.now()
+            self.saveData(os.path.join(self.autosaveDir, f"{self.protocolnameLabel.text().strip(' ')}-{self.samplenumberLabel.text()} time - {now.strftime('%H-%M-%S, %Y%m%d')} Scintomatic AUTOSAVE"), exported=now)
 
 
     def reinit(self):
@@ -302,28 +551,41 @@ class TimePanel(PlotPanel):
         self.lineplot.setLabel('bottom', "Time (sec)", **self.axislabelstyles)
 
 
+    def showProgress(self):
+        """
+        Overridden from the parent class; we don't know the total time, so just make the ring spin.
+        """
+        self.progressRing.setSweep((self.progressRing.beginAngle+29) % 360, (self.progressRing.beginAngle+59) % 360)
+        self.progressRing.setText("\u22ef")
+        self.progressLabel.setText(f"{self.npoints} points")
+
+
 
 
 class SpectrumPanel(PlotPanel):
     # An heir of PlotPanel that specializes in plotting channel spectra
 
+    openGLCapable = False # PlotCurveItem's paintGL() draws only the line, ignoring fillIn()'s fill
+
     def __init__(self, parent):
         super(SpectrumPanel, self).__init__(parent)
+        self.fixedXRange = (0, 1023)
         self.reinit()
         self.lineplot.setLabel('bottom', "Channel number", **self.axislabelstyles)
         self.lineplot.setLabel('left', "Counts", **self.axislabelstyles)
         self.lineplot.showGrid(x=True, y=True)
 
 
-    def saveData(self, destfilename):
+    def saveData(self, destfilename, exported=None):
         """
         Generates a tab-separated text file containing the received data
-        represented in the plot.
+        represented in the plot. exported is the datetime to record as the time of export, if not now.
         """
-        textFile = open(f"{destfilename}.txt", 'w') # Use 'a' if you want to append instead
+        exported = exported or datetime.now()
+        textFile = open(f"{destfilename}.txt", 'w', buffering=1<<20) # Use 'a' if you want to append instead; 1 MB buffer so even long runs are a few write()s
         textFile.write("# Scintomatic \n")
         textFile.write("# Spectrum record \n")
-        textFile.write(f"# Exported: {datetime.now().strftime('%H:%M:%S, %A, %b %d, %Y')} \n")
+        textFile.write(f"# Exported: {exported.strftime('%H:%M:%S, %A, %b %d, %Y')} \n")
         textFile.write(f"# Measurement type: {self.protocolnameLabel.text()} \n")
         textFile.write(f"# Measurement date (instrument time): {self.dateLabel.text()} \n")
         textFile.write(f"# Measurement sample number: {self.samplenumberLabel.text()} \n")
@@ -333,8 +595,7 @@ class SpectrumPanel(PlotPanel):
         textFile.write("# \n")
         textFile.write("# Disclaimer: Data interpreted from an encoding protocol which was reverse-engineered without documentation or confirmation. No guarantee of correctness is given.\n")
         textFile.write(f"# Channel number\tCounts\n")
-        for channel, counts in zip(self.xdata, self.ydata):
-            textFile.write(f"{channel}\t{counts}\n")
+        np.savetxt(textFile, np.column_stack((self.xdata, self.ydata)), fmt='%.15g', delimiter='\t')
         textFile.close()
 
 
@@ -343,48 +604,175 @@ class SpectrumPanel(PlotPanel):
         Invokes the saveData the current data. Intended to be used when a time data or spectra
         collection has concluded. Yes, these files will tend to pile up...
         """
-        if self.autosaveSwitch.isChecked() and len(self.ydata) > 0:
-            self.saveData(os.path.join(self.autosaveDir, f"{self.protocolnameLabel.text().strip(' ')}-{self.samplenumberLabel.text()} spectrum - {datetime.now().strftime('%H-%M-%S, %Y%m%d')} Scintomatic AUTOSAVE"))
+        if self.autosaveSwitch.isChecked() and self.npoints > 0:
+            now = datetime.now()
+            self.saveData(os.path.join(self.autosaveDir, f"{self.protocolnameLabel.text().strip(' ')}-{self.samplenumberLabel.text()} spectrum - {now.strftime('%H-%M-%S, %Y%m%d')} Scintomatic AUTOSAVE"), exported=now)
 
 
     def reinit(self):
         """
-        Overridden from the parent class to fill in the area between the line and 0.
+        Overridden from the parent class to stop filling in the area between the line and 0,
+        which pyqtgraph would otherwise re-tessellate on every live redraw; fillIn() restores it.
         """
         super().reinit()
-        self.lineplot.clear()
-        self.plotline = self.lineplot.plot(self.xdata, self.ydata, pen=self.linepen, fillLevel=0, brush=self.fillbrush) # Ahahahaaaaa
+        self._xbuf = np.arange(len(self._xbuf), dtype=np.float64) # Channel numbers never change, so fill them all in now
+        self._ybuf = np.zeros(len(self._ybuf), dtype=np.float64) # Unreported channels are zero counts, not leftover memory
+        self.plotline.setFillLevel(None)
+
+
+    def _reserve(self, needed):
+        """
+        Overridden from the parent class to number (and zero) any channels beyond the usual 1024, were that ever to happen.
+        """
+        capacity = len(self._xbuf)
+        super()._reserve(needed)
+        if len(self._xbuf) > capacity:
+            self._xbuf[capacity:] = np.arange(capacity, len(self._xbuf))
+            self._ybuf[capacity:] = 0 # np.resize() pads by repeating, not with zeros
+
+
+    def extendCounts(self, counts):
+        """
+        Records the counts of the next len(counts) channels; call redraw() to show them.
+        """
+        count = len(counts)
+        if count==0:
+            return
+        self._reserve(self.npoints + count)
+        self._ybuf[self.npoints:self.npoints+count] = counts
+        self.npoints += count
+        self.ymax = max(self.ymax, int(counts.max()))
+
 
+    def showProgress(self):
+        """
+        Overridden from the parent class to show how many of the 1024 channels are in.
+        """
+        self.progressRing.setSweep(0, int(359*self.npoints/1024))
+        self.progressLabel.setText(f"{self.npoints}/1024")
+
+
+    def fillIn(self):
+        """
+        Fills in the area between the line and 0, once the spectrum is complete.
+        """
+        self.plotline.setFillLevel(0)
+        self.plotline.setBrush(self.fillbrush)
 
 
 
-# Worker-thread-to-be that monitors for new RS-232 traffic from the scintillation counter
-class SerialHelper(QtCore.QObject):
-    # Signals must be defined as part of the class prototype [https://stackoverflow.com/q/36559713]
-    youvegotmail = QtCore.Signal()
 
-    def __init__(self, scintillationcounter, serialinqueue, parent=None):
-        super(SerialHelper, self).__init__(parent)
+# Worker, run by the global QThreadPool, that monitors for new RS-232 traffic from the scintillation counter
+class SerialHelper(QtCore.QRunnable):
+
+    class Signals(QtCore.QObject):
+        # QRunnables aren't QObjects, so can't have signals of their own [https://doc.qt.io/qtforpython-6/PySide6/QtCore/QRunnable.html]
+        # Signals must be defined as part of the class prototype [https://stackoverflow.com/q/36559713]
+        youvegotmail = QtCore.Signal()
+
+    def __init__(self, scintillationcounter, serialinqueue):
+        super(SerialHelper, self).__init__()
+        self.setAutoDelete(False) # We hang onto it, to ask it to stop
+        self.signals = SerialHelper.Signals() # Created here, so it lives in (and delivers to) the main thread
+        self._interruptionMutex = QtCore.QMutex()
+        self._interruptionRequested = False
+        self._finished = QtCore.QSemaphore(0) # Released once run() returns, for wait()
         self.scintcomm = scintillationcounter # A configured, active CommBasics-descended instance
         self.serialinqueue = serialinqueue # For relaying inbound serial traffic to the main thread
+        self._rxbuf = bytearray() # Bytes read but not yet terminated into a line
+        # On POSIX, wait on the port's file descriptor itself, waking the moment bytes arrive [https://docs.python.org/3/library/selectors.html]
+        try:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.scintcomm.devcomm.fileno(), selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError): # e.g. Windows, where PySerial ports have no fileno()
+            self._selector = None
         logging.debug("Serial thread launched!") # diagnostics
 
 
-    @QtCore.Slot()
+    def requestInterruption(self):
+        """
+        Asks checkSerial() to stop, at its next pass through its loop. Safe to call from any thread.
+        """
+        with QtCore.QMutexLocker(self._interruptionMutex):
+            self._interruptionRequested = True
+
+
+    def isInterruptionRequested(self):
+        with QtCore.QMutexLocker(self._interruptionMutex):
+            return self._interruptionRequested
+
+
+    def wait(self, msecs):
+        """
+        Waits up to msecs for run() to return, as QThread.wait() would; returns whether it has.
+        """
+        if self._finished.tryAcquire(1, msecs):
+            self._finished.release() # Leave it for anyone else who asks
+            return True
+        return False
+
+
+    def run(self):
+        """
+        QRunnable's entry point, called in one of the QThreadPool's threads.
+        """
+        try:
+            self.checkSerial()
+        finally:
+            self._finished.release()
+
+
     def checkSerial(self):
         """
-        The parent SerialHelper QObject will be moved to a new Thread (by a moveToThread() call
-        in the main Scintomatic thread) and assigned to run checkSerial(). 
-        (See, this is why people want to subclass QThread...)
+        Loops, relaying serial traffic, until requestInterruption() is called.
+        Rather than read_until(), which PySerial implements as a read(1) per byte, we read everything
+        the port has waiting in one call and split it into lines ourselves.
         """
-        while not QtCore.QThread.currentThread().isInterruptionRequested():
+        port = self.scintcomm.devcomm
+        waittime = port.timeout or 2 # (sec) How long a wait for traffic counts as a timeout
+        # Like read_until(), pass on an unterminated line every waittime even while bytes keep coming,
+        # as binary spectrum blocks have no terminator until their very end
+        self._flushDeadline = QtCore.QDeadlineTimer(int(1000*waittime))
+        while not self.isInterruptionRequested():
             logging.debug("Serial thread checking for mail!")
-            receivedbytes = self.scintcomm.read_until(b'\r')
-            #receivedbytes = self.scintcomm.devcomm.read(1)
-            logging.debug(f"Serial thread inbox ({len(receivedbytes)} bytes): '{receivedbytes}'\n") # diagnostics
+            if self._selector is None:
+                chunk = port.read(max(1, port.in_waiting)) # Blocks for up to the port's timeout if nothing's waiting
+            elif self._selector.select(timeout=waittime):
+                chunk = port.read(max(1, port.in_waiting)) # Returns at once, as there's something waiting
+            else:
+                chunk = b''
+            if chunk:
+                self._rxbuf += chunk
+                if self._queueLines():
+                    self._flushDeadline.setRemainingTime(int(1000*waittime))
+            if not chunk or (self._rxbuf and self._flushDeadline.hasExpired()):
+                # Timed out; pass on whatever we have, terminated or not (even nothing), as read_until() would have
+                self.serialinqueue.put(bytes(self._rxbuf))
+                self._rxbuf.clear()
+                self.signals.youvegotmail.emit()
+                self._flushDeadline.setRemainingTime(int(1000*waittime))
+        if self._selector is not None:
+            self._selector.close()
+
+
+    def _queueLines(self):
+        """
+        Moves every complete line in self._rxbuf, terminator included, onto the queue,
+        with one youvegotmail signal for the lot; returns whether there were any.
+        """
+        start = 0
+        while True:
+            end = self._rxbuf.find(b'\r', start)
+            if end < 0:
+                break
+            receivedbytes = bytes(self._rxbuf[start:end+1])
+            logging.debug("Serial thread inbox (%d bytes): '%s'\n", len(receivedbytes), receivedbytes) # diagnostics; %-style, so nothing's formatted unless it's logged
             self.serialinqueue.put(receivedbytes)
-            self.youvegotmail.emit()
-            time.sleep(0.05)
+            start = end + 1
+        if start:
+            del self._rxbuf[:start]
+            self.signals.youvegotmail.emit()
+        return start > 0
 
 
 
@@ -490,10 +878,12 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
         # Flags and regexes for interpreter()
         self.prevline = b''
         self.binaryblock = False        
-        self.regex_protocolname_time = re.compile(b"Name\:\<([\ \-\w]*)\>([0-9]*)\ ([A-Za-z\.]*)([0-9]{4})") # Line before the "Start Time" one in a time preamble should contain the protocol name and the date
-        self.regex_time = re.compile(b"\{t([\ 0-9]*)R\:([\ 0-9]*)") # During time readouts, one line gives time and CPM...
-        self.regex_altline_time = re.compile(b"\[\<([\ \-\w]*)\>S\: *([0-9]*)") # ...alternating with another line giving protocol name and sample number
-        self.regex_protocolname_spectrum = re.compile(b"\[([\ \-\w]*)\] *([0-9]*) ([A-Za-z\.]*)([0-9]{4,4})") # In a spectrum preamble, the line before the "Start Time" one should contain the protocol name and datestamp
+        self.binarybuffer = bytearray() # Binary spectrum bytes not yet decoded; see _decodeBinaryBuffer()
+        # Compiled once, as bytes patterns, since serial lines stay bytes all the way to _fields()
+        self.regex_protocolname_time = re.compile(rb"Name\:\<([\ \-\w]*)\>([0-9]*)\ ([A-Za-z\.]*)([0-9]{4})") # Line before the "Start Time" one in a time preamble should contain the protocol name and the date
+        self.regex_time = re.compile(rb"\{t([\ 0-9]*)R\:([\ 0-9]*)") # During time readouts, one line gives time and CPM...
+        self.regex_altline_time = re.compile(rb"\[\<([\ \-\w]*)\>S\: *([0-9]*)") # ...alternating with another line giving protocol name and sample number
+        self.regex_protocolname_spectrum = re.compile(rb"\[([\ \-\w]*)\] *([0-9]*) ([A-Za-z\.]*)([0-9]{4,4})") # In a spectrum preamble, the line before the "Start Time" one should contain the protocol name and datestamp
         
         # Use a timer to trigger any cutesy UI effects we might want
         # self.interpretTimer = QtCore.QTimer()
@@ -501,9 +891,18 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
         # self.interpretTimer.setInterval(200) # Could also use zero-millisecond timer, but that's on its way out [https://doc.qt.io/qtforpython-5/PySide2/QtCore/QTimer.html]
         # self.interpretTimer.timeout.connect(self.interpreter)
 
+        # Parsing a line only marks its panel as needing a redraw; this timer does the (much costlier) redrawing,
+        # along with the progress ring and label, at most once per interval no matter how fast lines arrive
+        self._dirtyPanels = set()
+        self._redrawTimer = QtCore.QTimer(self)
+        self._redrawTimer.setSingleShot(True)
+        self._redrawTimer.setInterval(33) # (msec) ~30 Hz, about as fast as anyone can read a progress label
+        self._redrawTimer.timeout.connect(self._flushPlots)
+
         # Finally, initialize some data flags
         self.prevtime = -1
         self.non_sec_mode = False
+        self.altline = None # The last line the time panel's protocol name and sample number were parsed from
         self.bitsum = 0
         
         # For layout testing only
@@ -511,6 +910,26 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
         # self.spectrumpanel.progressLabel.setText("1024/1024")
 
 
+    def _scheduleRedraw(self, panel):
+        """
+        Marks a PlotPanel as having new data, to be shown at the next _flushPlots().
+        """
+        self._dirtyPanels.add(panel)
+        if not self._redrawTimer.isActive():
+            self._redrawTimer.start()
+
+
+    @QtCore.Slot()
+    def _flushPlots(self):
+        """
+        Redraws every panel that's received data since the last flush, and updates its progress display.
+        """
+        for panel in self._dirtyPanels:
+            panel.redraw()
+            panel.showProgress()
+        self._dirtyPanels.clear()
+
+
     def refresh_comms(self):
         """
         Uses pyserial to inventory the system's serial ports [https://stackoverflow.com/a/52809180]
@@ -540,22 +959,17 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
                 self.serialSwitch.setChecked(False)
                 raise serialkiller
 
-            # Prepare a helper thread for serial communication [https://stackoverflow.com/a/33453124]
+            # Hand a helper for serial communication to the thread pool [https://doc.qt.io/qtforpython-6/PySide6/QtCore/QThreadPool.html]
             self.serialinqueue = queue.Queue()
-            # self.serialhelper = SerialHelper()
             self.serialhelper = SerialHelper(self.scintcomm, self.serialinqueue)
-            self.serialthread = QtCore.QThread()
-            self.serialhelper.youvegotmail.connect(self.interpreter) # Trigger our interpreter on the helper's signal
-            self.serialhelper.moveToThread(self.serialthread)
-            self.serialthread.started.connect(self.serialhelper.checkSerial) # Thread should start listening as soon as it launches
-            self.serialthread.start() # Launches the thread
+            self.serialhelper.signals.youvegotmail.connect(self.interpreter) # Trigger our interpreter on the helper's signal
+            QtCore.QThreadPool.globalInstance().start(self.serialhelper) # Starts listening as soon as a pool thread picks it up
             self.serialLabel.setText("<i>Monitoring for serial traffic...</i>")
         else:
             self.serialLabel.setText("<i>Shutting down serial thread, give me a sec...</i>")
             try:
-                self.serialthread.requestInterruption()
-                self.serialthread.wait(2050)
-                self.serialthread.quit()
+                self.serialhelper.requestInterruption()
+                self.serialhelper.wait(2050)
                 self.scintcomm.closeport()
             except AttributeError:
                 logging.warning(f"[Scintomatic.serialSwitch_responder] no serial thread running to exit.")
@@ -568,23 +982,100 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
         """
         Tries to make sense of what we receive via serial. Thanks to all the GUI update tasks this entails,
         this method must run in the primary thread (or we'd have to add a lot of queues.)
+        Each youvegotmail signal is just a wakeup: we work through everything queued by then,
+        so lines arriving faster than signals are delivered don't pile up behind them.
+        """
+        while True:
+            try:
+                rawbytes = self.serialinqueue.get(block=False)
+            except queue.Empty: # [https://docs.python.org/3/library/queue.html#queue.Queue.get]
+                break
+            try:
+                self._parse_line(rawbytes)
+            except ScintomaticError as e: # Logged rather than raised, so the lines queued behind this one still get seen now
+                logging.error(str(e))
+        if self.binaryblock:
+            self._decodeBinaryBuffer() # One decode for the whole batch of spectrum lines, rather than one per line
+
+
+    @staticmethod
+    def _fields(regex, line):
+        """
+        Returns the groups of regex's first match in line, like findall(line)[0] but without
+        scanning on for (and listing) the rest; raises IndexError if there's no match, as that did.
+        """
+        match = regex.search(line)
+        if match is None:
+            raise IndexError(f"no match for {regex.pattern} in {line}")
+        return match.groups()
+
+
+    def _parse_line(self, rawbytes):
+        """
+        Interprets one line received via serial, for interpreter().
 
         CAUTION: much of this code is specific to the BetaScout/Triathler scintillation counters.
         Furthermore, it makes assumptions about how these devices behave based on
         only a few observations of their operations.
         """
-        try:
-            rawbytes = self.serialinqueue.get(block=False)
-        except queue.Empty: # [https://docs.python.org/3/library/queue.html#queue.Queue.get]
-            return False
+        # Binary spectrum data comes first, as it's what arrives thickest and fastest; it's taken exactly as received,
+        # without strip()ping (which would copy it, and could shed data bytes of value 10) or updating serialLabel or prevline
+        if self.binaryblock and not rawbytes.startswith(b'=>End(binary)', 1 if rawbytes[0:1]==b'\n' else 0):
+            """
+            According to our reverse-engineering—the results of which have no authoritative confirmation!—
+            the Triathler/BetaScout Commfil v.2 protocol encodes spectrum data (counts only)
+            using a mini form of run-length encoding (RLE)[https://www.fileformat.info/mirror/egff/ch09_03.htm]
+            only for the value 0. When the byte with decimal value 251 (=0xfb) is transmitted,
+            the next byte will represent the number of consecutive 0s, from 1 to 251;
+            if the run of 0s is longer than 251, a third 251 byte will signal the beginning of a fresh RLE run.
+            All non-zero values are written out, each followed by a 255 (=0xff) byte;
+            values larger than a single byte's (after reserved values) 250 capacity
+            will be represented by two or more bytes, with little-endian byte order such that
+            the least-significant byte (LSB) comes first and the most significant byte (MSB) appears last,
+            to represent a base-250 number (evidenced by that decimal value not appearing in the data.)
+            Byte values 252, 253, 254 are also reserved for the end-of-binary-block,
+            the value 13, and the value 35, respectively.
+
+            TL;DR the spectrum binary representation is composed of these byte combinations:
+
+                (251 (=\xfb), number of consecutive repeats) for each runs of 0s numbering <= 251
+                    Note the lack of a 255 delineator following.
+                	Never occurs except after 255 (or another 251).
+                	Its appearance means the next value will be a number of repetitions;
+                        this can be followed without a 255 divider by the next non-zero value,
+                        or by a 251 (the third consecutive) signalling the beginning of another batch of zeros.
+                	Two consecutive 251s means literally 251 zeros.
+
+                (value, 255 (=\xff)) for a single non-zero value < 250
+
+                (LSB, [...,] MSB, 255) , in base-250, for a single non-zero value >= 250
+
+                253 (=\xfd) is 13
+                    Always appears where surrounding data strongly suggest 13, whereas \r does not occur within the binary blocks until paired with \n at the very end.
+                	Since the latin-1 character set encodes this value as the carriage return \r, which is (part of) the instrument's line terminator, I suspect the substitution was made to avoid interrupting the serial transfer block.
+
+                254 (\xfe) = 35
+                    Always appears where 35 is plausible, whereas 35 doesn't appear anywhere.
+                	The reason for this substitution is not clear to me.
+                    It's also possible this is another encoding issue introduced somewhere in the readout serial stack.
+
+                252 (=\xfc) denotes end of stream
+                    Does not appear anywhere else.
+            """
+            logging.debug("Raw rawbytes (len %d): %s\n  last 10 bytes '%s'", len(rawbytes), rawbytes, rawbytes[-10:])
+            # Just gather these up; interpreter() decodes (and bitsums) them all at once, when it's drained the queue.
+            # Since the buffer keeps any chunk a read timed out in the middle of, it'll be whole by then without any patching up
+            self.binarybuffer += rawbytes
+            return
+
         receivedbytes = rawbytes.strip(b'\n')
-        # If serialthread's read timed out without receiving anything, we still get called
+        # If serialhelper's read timed out without receiving anything, we still get called
         if receivedbytes==b'':
             self.serialLabel.setText("<i>:: crickets ::</i>")
             return False
         else:
-            displayline = self.scintcomm.tostring(receivedbytes).encode('unicode_escape').decode() # The 'unicode_escape' encoding double-backslashes the control sequences
-            self.serialLabel.setText(displayline[0:64] + ('...' if len(displayline) > 64 else ''))
+            displayline = self.scintcomm.tostring(receivedbytes[0:64]).encode('unicode_escape').decode() # The 'unicode_escape' encoding double-backslashes the control sequences
+            self.serialLabel.setText(displayline[0:64] + ('...' if len(receivedbytes) > 64 or len(displayline) > 64 else ''))
             
         # Check for known patterns
         if receivedbytes.startswith(b'Start Time '):
@@ -597,10 +1088,11 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
                 self.spectrumpanel.reinit()
                 self.bitsum = 0
                 self.vfoldaway.expand(self.foldaway_spectrum)
-                if len(self.timepanel.ydata) > 0:
+                if self.timepanel.npoints > 0:
+                    self._flushPlots() # So a pending time panel flush can't set its ring spinning again
                     self.timepanel.progressRing.setSweep(0, 359) # Spectrum is usually preceded by a time run
                 self.spectrumpanel.starttimeLabel.setText(starttimetext)
-                (protocolname, dateDay, dateMonth, dateYear) = self.regex_protocolname_spectrum.findall(self.prevline)[0]
+                (protocolname, dateDay, dateMonth, dateYear) = self._fields(self.regex_protocolname_spectrum, self.prevline)
                 self.spectrumpanel.protocolnameLabel.setText(self.scintcomm.tostring(protocolname))
                 self.spectrumpanel.dateLabel.setText(f"{self.scintcomm.tostring(dateDay)} {self.scintcomm.tostring(dateMonth)} {self.scintcomm.tostring(dateYear)}")
             elif self.prevline.startswith(b'Name:< '):
@@ -609,55 +1101,57 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
                 self.timepanel.reinit()
                 self.prevtime = -1
                 self.non_sec_mode = False
+                self.altline = None
                 self.vfoldaway.expand(self.foldaway_time)
                 self.vfoldaway.collapse(self.foldaway_spectrum) # Since the spectrum is now for the previous readout
                 self.timepanel.starttimeLabel.setText(starttimetext)
-                (protocolname, dateDay, dateMonth, dateYear) = self.regex_protocolname_time.findall(self.prevline)[0]
+                (protocolname, dateDay, dateMonth, dateYear) = self._fields(self.regex_protocolname_time, self.prevline)
                 self.timepanel.dateLabel.setText(f"{self.scintcomm.tostring(dateDay)} {self.scintcomm.tostring(dateMonth)} {self.scintcomm.tostring(dateYear)}")
         elif receivedbytes.startswith(b'{t '):
             # Time count in progress (only transmitted in Commfil v.2 mode, I believe!)
-            (rawtime, counts) = self.regex_time.findall(receivedbytes)[0]
-            if int(rawtime) < self.prevtime:
+            (rawtime, counts) = self._fields(self.regex_time, receivedbytes)
+            (rawtime, counts) = (int(rawtime), int(counts)) # int() takes the bytes (spaces and all) as they are
+            if rawtime < self.prevtime:
                 # Time went backwards? We must have started a new sample and missed the preamble (granted, an edge case)
                 self.timepanel.autosave()
                 self.timepanel.reinit()
                 self.vfoldaway.expand(self.foldaway_time)
                 self.non_sec_mode = False
-            elif int(rawtime)==self.prevtime: # The instrument gives one time update per second, no matter which units of time (seconds, minutes, etc.) it's using
+            elif rawtime==self.prevtime and not self.non_sec_mode: # The instrument gives one time update per second, no matter which units of time (seconds, minutes, etc.) it's using
                 self.non_sec_mode = True
                 self.timepanel.lineplot.setLabel('bottom', "Time (sec) (assuming one data point per sec)", **self.timepanel.axislabelstyles)
-            self.timepanel.xdata.append(self.timepanel.xdata[-1]+1 if self.non_sec_mode else int(rawtime))
-            self.timepanel.ydata.append(int(counts))
-            self.timepanel.plotline.setData(self.timepanel.xdata, self.timepanel.ydata)
+            self.timepanel.append(self.timepanel.xdata[-1]+1 if self.non_sec_mode else rawtime, counts)
+            self._scheduleRedraw(self.timepanel)
             # self.timepanel.lineplot.setXRange(0, self.timepanel.xdata[-1], padding=0)
-            self.timepanel.progressRing.setSweep((self.timepanel.progressRing.beginAngle+29) % 360, (self.timepanel.progressRing.beginAngle+59) % 360) # We don't know total time, so just make the ring spin
-            self.timepanel.progressRing.setText("\u22ef")
-            self.timepanel.progressLabel.setText(f"{len(self.timepanel.ydata)} points")
-            self.prevtime = int(rawtime)
+            self.prevtime = rawtime
             
             # The previous line should contain the protocol name; only sample #1 gets the full preamble, so we'll try to parse every one of these
-            try:
-                (protocolname, samplenumber) = self.regex_altline_time.findall(self.prevline)[0]
-                self.timepanel.protocolnameLabel.setText(self.scintcomm.tostring(protocolname))
-                # TODO reinit() if sampleNumber is not the same as the currently-displayed?
-                self.timepanel.samplenumberLabel.setText(self.scintcomm.tostring(sampleNumber))
-            except (IndexError, NameError) as e:
-                logging.warning(f"Failed to find a protocol name and/or sample number in prev line '{self.prevline}' because: {repr(e)}")
+            # (but it's the same line over and over within a readout, so only when it changes)
+            if self.prevline!=self.altline:
+                try:
+                    (protocolname, samplenumber) = self._fields(self.regex_altline_time, self.prevline)
+                    self.timepanel.protocolnameLabel.setText(self.scintcomm.tostring(protocolname))
+                    # TODO reinit() if sampleNumber is not the same as the currently-displayed?
+                    self.timepanel.samplenumberLabel.setText(self.scintcomm.tostring(samplenumber))
+                    self.altline = self.prevline
+                except IndexError as e:
+                    logging.warning(f"Failed to find a protocol name and/or sample number in prev line '{self.prevline}' because: {repr(e)}")
         elif receivedbytes.startswith(b'=>Start(binary)'):
             # Start of a binary-encoded block, which is used for spectrum in Commfil v.2 mode
             self.binaryblock = True
-            self.interrupted_bytechunk = b''
+            self.binarybuffer = bytearray()
             self.spectrumpanel.progressRing.setSweep(0, 0)
             self.spectrumpanel.progressLabel.setText("0/1024")
         elif receivedbytes.startswith(b'=>End(binary)'):
             # End of a binary-encoded block, which is used for spectrum in Commfil v.2 mode
             self.binaryblock = False
             self.spectrumpanel.progressRing.setSweep(0, 359)
-            # Clear out the queue of interrupted bytechunks, which we must have misidentified
-            self.bytechunk_interpreter([self.interrupted_bytechunk]) # interrupted_bytechunk must be a single bytearray (which isn't a list) by the way we assign it
-            if not len(self.spectrumpanel.ydata)==1024:
+            self._decodeBinaryBuffer(final=True) # Whatever's left must be whole, or as whole as it's going to get
+            self.spectrumpanel.fillIn()
+            self.spectrumpanel.finishRange()
+            if not self.spectrumpanel.npoints==1024:
                 self.spectrumpanel.progressRing.setText("\u2757")
-                raise ScintomaticError(f"Crap, I have {len(self.spectrumpanel.ydata)} data points instead of 1024...")
+                raise ScintomaticError(f"Crap, I have {self.spectrumpanel.npoints} data points instead of 1024...")
         elif receivedbytes.startswith(b'Bitsum:'):
             theirbitsum = int(receivedbytes[7:])
             logging.info(f"Spectrum bitsum: instrument says {theirbitsum}, we have {self.bitsum}.") 
@@ -666,148 +1160,39 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
             else:
                 self.spectrumpanel.progressRing.setText("\u2248")
                 logging.warning(f"Spectrum bitsum mismatch: have {self.bitsum} vs transmitted {theirbitsum}.") # Known issue--bitsum hasn't been figured out
-        elif self.binaryblock:
-            """
-            According to our reverse-engineering—the results of which have no authoritative confirmation!—
-            the Triathler/BetaScout Commfil v.2 protocol encodes spectrum data (counts only)
-            using a mini form of run-length encoding (RLE)[https://www.fileformat.info/mirror/egff/ch09_03.htm]
-            only for the value 0. When the byte with decimal value 251 (=0xfb) is transmitted,
-            the next byte will represent the number of consecutive 0s, from 1 to 251;
-            if the run of 0s is longer than 251, a third 251 byte will signal the beginning of a fresh RLE run.
-            All non-zero values are written out, each followed by a 255 (=0xff) byte;
-            values larger than a single byte's (after reserved values) 250 capacity
-            will be represented by two or more bytes, with little-endian byte order such that
-            the least-significant byte (LSB) comes first and the most significant byte (MSB) appears last,
-            to represent a base-250 number (evidenced by that decimal value not appearing in the data.)
-            Byte values 252, 253, 254 are also reserved for the end-of-binary-block,
-            the value 13, and the value 35, respectively.
-
-            TL;DR the spectrum binary representation is composed of these byte combinations:
-
-                (251 (=\xfb), number of consecutive repeats) for each runs of 0s numbering <= 251
-                    Note the lack of a 255 delineator following.
-                	Never occurs except after 255 (or another 251).
-                	Its appearance means the next value will be a number of repetitions;
-                        this can be followed without a 255 divider by the next non-zero value,
-                        or by a 251 (the third consecutive) signalling the beginning of another batch of zeros.
-                	Two consecutive 251s means literally 251 zeros.
 
-                (value, 255 (=\xff)) for a single non-zero value < 250
-
-                (LSB, [...,] MSB, 255) , in base-250, for a single non-zero value >= 250
-
-                253 (=\xfd) is 13
-                    Always appears where surrounding data strongly suggest 13, whereas \r does not occur within the binary blocks until paired with \n at the very end.
-                	Since the latin-1 character set encodes this value as the carriage return \r, which is (part of) the instrument's line terminator, I suspect the substitution was made to avoid interrupting the serial transfer block.
+        # The line before triggers often contains semi-useful information...
+        self.prevline = receivedbytes
 
-                254 (\xfe) = 35
-                    Always appears where 35 is plausible, whereas 35 doesn't appear anywhere.
-                	The reason for this substitution is not clear to me.
-                    It's also possible this is another encoding issue introduced somewhere in the readout serial stack.
 
-                252 (=\xfc) denotes end of stream
-                    Does not appear anywhere else.
-            """
-            logging.debug(f"Raw rawbytes (len {len(rawbytes)}): {rawbytes}\n  last 10 bytes '{rawbytes[-10:]}'")
-            bytechunks = self.scintcomm.tobytes(rawbytes).split(b'\xff') # Split into chunks demarcated by the value divider
-            logging.debug(f"Post-chunking rawbytes ({len(bytechunks)} chunks): {bytechunks} \n  last chunk: '{rawbytes[-1]}'")
-
-            # First, figure out whether the last read_until() timed out in the middle of a chunk
-            if not self.interrupted_bytechunk==b'':
-                logging.debug(f"Interrupted bytechunk is present from last time.")
-                if rawbytes[0:1]==b'\xff': # Note that slicing, not indexing, is necessary to not get an int [https://stackoverflow.com/q/28249597]
-                    # The previous batch's last bytechunk was indeed ended. Add it to the front of the queue
-                    bytechunks.insert(0, self.interrupted_bytechunk)
-                    logging.debug(f"Added previous interrupted bytechunk to the front of the line, now {bytechunks}")
-                elif rawbytes[0:1]==b'\xfc':
-                    # Same thing, although edge case
-                    bytechunks.insert(0, self.interrupted_bytechunk)
-                    logging.debug(f"Added previous interrupted bytechunk (\xfc flag) to the front of the line, now {bytechunks}")
-                else:
-                    # The previous batch snipped its last chunk down the middle, and this is the other piece
-                    bytechunks[0] = self.interrupted_bytechunk + bytechunks[0]
-                    logging.debug(f"Added previous interrupted chunk half to the front of the line, now {bytechunks}")
-            # Now, how about this read?
-            if not (rawbytes[-1:]==b'\xff' or rawbytes[-1:]==b'\xfc'):
-                # Our last current bytechunk wasn't ended for sure # TODO I suspect this is always triggering, but need to get confirmation
-                logging.debug(f"Rawbytes ends with {rawbytes[-4:]}--last byte '{rawbytes[-1:]}'--which looks possibly interrupted... removing and storing last bytechunk '{bytechunks[-1]}'\n  bytechunks now {bytechunks}") # diagnostics
-                self.interrupted_bytechunk = bytechunks[-1]
-                bytechunks[-1] = b''
-                logging.debug(f"  bytechunks now {bytechunks}") # diagnostics
-            else:
-                # Pretty sure the last bytechunk is whole
-                logging.debug(f"Last 10 raw bytes were '{rawbytes[-10:]}', which looks complete. Clearing interrupted bytechunk (previously '{self.interrupted_bytechunk}').")
-                self.interrupted_bytechunk = b''
-            # Now we can process our list of bytechunks
+    def _decodeBinaryBuffer(self, final=False):
+        """
+        Hands bytechunk_interpreter() the whole bytechunks gathered so far in self.binarybuffer--everything up to
+        its last b'\xff' separator, or simply everything if final--and keeps the rest for when it's complete.
+        Their bits are counted toward the bitsum on the way, while they're fresh in the cache; by the time
+        the instrument sends its Bitsum line, the final call has counted every byte of the block.
+        """
+        end = len(self.binarybuffer) if final else self.binarybuffer.rfind(b'\xff') + 1
+        if end:
+            bytechunks = self.binarybuffer[:end]
+            self.bitsum += popcount(bytechunks) # TODO this may count read terminators... and is still waaaaay off
             self.bytechunk_interpreter(bytechunks)
-            self.spectrumpanel.progressRing.setSweep(0, int(359*len(self.spectrumpanel.ydata)/1024))
-            # self.spectrumpanel.lineplot.setXRange(0, self.spectrumpanel.xdata[-1], padding=0)
-            self.bitsum += sum([bin(rawbyte).count("1") for rawbyte in rawbytes]) # Eventually replace with Python 3.10's new faster int.bit_count() [https://stackoverflow.com/a/64848298] # TODO this may count read terminators... and is still waaaaay off
-            logging.debug(f"ydata now {len(self.spectrumpanel.ydata)} values.")
-
-        # The line before triggers often contains semi-useful information...
-        self.prevline = receivedbytes
+            del self.binarybuffer[:end]
+            logging.debug("ydata now %d values.", self.spectrumpanel.npoints)
 
 
     def bytechunk_interpreter(self, bytechunks):
         """
-        Takes a list of bytechunks--the binary stream from the instrument, split by
-        the b'\xff' separator values--and outputs a list of decoded decimal values
-        directly to the interface.
+        Takes bytechunks--the binary stream from the instrument, in its whole b'\xff'-separated chunks--
+        and outputs the decoded decimal values (see decode_spectrum()) directly to the interface.
         (Undecided on the wisdom of having this function directly modify class-held storage arrays;
         it simplifies things a bit and avoids one additional structure to pass around, but it feels dangerous...)
         """
-        logging.debug(f"bytechunk_interpreter processing {len(bytechunks)} bytechunks.") # diagnostics
-        for chunkno, bytechunk in enumerate(bytechunks):
-            try:
-                decchunk = list(bytechunk) # Convert bytes into decimal values [0-255]
-            except TypeError: # Means there's only one byte, which Python treats as an int
-                    decchunk = [bytechunk]
-            logging.debug(f"Bytechunk #{chunkno}: '{decchunk}'") # diagnostics
-            if len(decchunk)==0:
-                logging.debug(f" ...was empty. Skipping.") # diagnostics
-                continue
-            elif decchunk[0]==251:
-                chunkindex = 0
-                while chunkindex < len(decchunk):
-                    if decchunk[chunkindex]==251: # Looks stupid, but I can't think of a cleverer yet safe way
-                        self.spectrumpanel.ydata.extend([0]*self.byte_reconstructor([decchunk[chunkindex+1]])) # Extend vs append: [https://stackoverflow.com/a/252711]
-                        logging.debug(f" -> added {self.byte_reconstructor([decchunk[chunkindex+1]])} 0s") # diagnostics
-                        chunkindex += 2
-                    elif decchunk[chunkindex]==252:
-                        logging.debug(f" -> end of stream flag found: '{decchunk[chunkindex:]}'.") # diagnostics
-                        break
-                    else:
-                        self.spectrumpanel.ydata.append(self.byte_reconstructor(decchunk[chunkindex:])) # A chunk can't contain more than one non-zero data value... probably famous last words
-                        logging.debug(f" -> added {self.byte_reconstructor(decchunk[chunkindex:])} (after the 0 stretch)") # diagnostics
-                        break # Data loss risk!
-            else:
-                self.spectrumpanel.ydata.append(self.byte_reconstructor(decchunk))
-                logging.debug(f" -> added {self.byte_reconstructor(decchunk)}") # diagnostics
-        self.spectrumpanel.xdata = range(0, len(self.spectrumpanel.ydata))
-        self.spectrumpanel.plotline.setData(self.spectrumpanel.xdata, self.spectrumpanel.ydata)
-        self.spectrumpanel.progressRing.setSweep(0, 360*float(len(self.spectrumpanel.ydata))/1024) # Not sure the event loop will ever get to show this anyway
-        self.spectrumpanel.progressLabel.setText(f"{len(self.spectrumpanel.ydata)}/1024")
-
-
-    def byte_reconstructor(self, LSB_to_MSB_dec_bytes):
-        """
-        Helper function that constructs a single decimal number from a list of bytes,
-        each expressed as a decimal value, in reverse MSB/LSB order.
-        Also takes care of the two special-case value substitutions.
-        """
-        translated_bytes = []
-        for byte in LSB_to_MSB_dec_bytes:
-            if byte==253:
-                translated_bytes.append(13)
-            elif byte==254:
-                translated_bytes.append(35)
-            elif byte==252: # With checks upstream, shouldn't be necessary... but we're leaving it in
-                break # End of spectrum indicator
-            else:
-                translated_bytes.append(byte)
-        translated_bytes = [byteval*(250**bytenum) for bytenum, byteval in enumerate(translated_bytes)]
-        return sum(translated_bytes)
+        logging.debug("bytechunk_interpreter processing %d bytes.", len(bytechunks)) # diagnostics
+        counts = decode_spectrum(bytes(bytechunks)) # numpy takes all the chunks in one go
+        logging.debug(" -> added %d values: %s", len(counts), counts) # diagnostics
+        self.spectrumpanel.extendCounts(counts)
+        self._scheduleRedraw(self.spectrumpanel) # Which also updates the progress ring and label
 
 
     def closeEvent(self, event):
@@ -817,30 +1202,29 @@ class Scintomatic(QtWidgets.QWidget): # QMainWindow vs QWidget: [http://stackove
         """
         self.serialLabel.setText("<i>Shutting down serial thread, give me a sec...</i>")
         try:
-            self.serialthread.requestInterruption()
-            self.serialthread.quit()
-            self.serialthread.wait(2050) # (msec) without traffic, serialhelper takes about this long to notice
+            self.serialhelper.requestInterruption()
+            self.serialhelper.wait(2050) # (msec) without traffic, serialhelper takes about this long to notice
             self.scintcomm.closeport()
         except AttributeError:
             pass
         try:
-            self.TimePanel.autosave()
-            self.SpectrumPanel.autosave()
+            self.timepanel.autosave()
+            self.spectrumpanel.autosave()
         except Exception:
             pass # Too late to do anything about it
         app.quit()
 
 
 
-class ScintomaticError(InstrumentComm.Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(ScintomaticError, self).__init__('ScintOMatic', errorMessage, proxyerror)
+class ScintomaticError(InstrumentComm.Instrument_Labeled_Exception):
+    instrumentType = 'ScintOMatic'
 
 
 
 
 if __name__ == '__main__':
     app = QtWidgets.QApplication(sys.argv)
+    QtWidgets.QApplication.setFont(QtGui.QFont('Arial', 10)) # Resolved once, and inherited by every widget not told otherwise
     m = Scintomatic()
     operatingsystem = platform.system()
     sys.exit(app.exec())
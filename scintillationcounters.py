@@ -7,6 +7,7 @@ the variety currently comprising just one type of machine.
 
 
 MODIFICATION HISTORY
+[10-14-2026] ScintillationCounterError is now a labeled InstrumentComm exception.
 [12-23-2021] First version.
 
 
@@ -180,6 +181,5 @@ class BetaScout(Triathler):
 #-------------------------------------------------------------------
 # Custom exception for scintillationcounter motion control devices
 
-class ScintillationCounterError(InstrumentComm.Instrument_Generic_Exception):
-    def __init__(self, errorMessage='', proxyerror=None):
-        super(ScintillationCounterError, self).__init__('ScintillationCounter', errorMessage, proxyerror)
+class ScintillationCounterError(InstrumentComm.Instrument_Labeled_Exception):
+    instrumentType = 'ScintillationCounter'